@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.security import HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update, func
+from sqlalchemy.orm.attributes import set_committed_value
 from datetime import timedelta
-import json
+import asyncio
 from ..models import User, get_db
-from ..services.auth import AuthService, get_current_active_user, security
+from ..services.auth import AuthService, get_current_active_user, get_current_token_claims, get_bearer_token
 from ..config import settings
 from .schemas import (
     UserRegistrationRequest,
@@ -20,31 +20,44 @@ from .schemas import (
 
 router = APIRouter(prefix="/api/v1/auth", tags=["Authentication"])
 
+def _user_response(user: User) -> UserResponse:
+    """Build a UserResponse from a User row"""
+    return UserResponse(
+        id=user.id,
+        email=user.email,
+        name=user.name,
+        role=user.role,
+        is_active=user.is_active,
+        skills=user.skills,
+        learning_progress=user.learning_progress,
+        created_at=user.created_at,
+        last_active=user.last_active
+    )
+
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
 async def register_user(
     user_data: UserRegistrationRequest,
     db: AsyncSession = Depends(get_db)
 ):
     """Register a new user"""
-    # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
-    existing_user = result.scalar_one_or_none()
+    # Check if user already exists (index-only lookup on users.email)
+    result = await db.execute(select(1).where(User.email == user_data.email).limit(1))
     
-    if existing_user:
+    if result.scalar() is not None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
     
-    # Create new user
-    hashed_password = AuthService.get_password_hash(user_data.password)
+    # Create new user (bcrypt is CPU-bound, keep it off the event loop)
+    hashed_password = await asyncio.to_thread(AuthService.get_password_hash, user_data.password)
     new_user = User(
         email=user_data.email,
         name=user_data.name,
         hashed_password=hashed_password,
         role=user_data.role.value,
-        skills_json="[]",
-        learning_progress_json="{}"
+        skills_json=[],
+        learning_progress_json={}
     )
     
     db.add(new_user)
@@ -52,17 +65,7 @@ async def register_user(
     await db.refresh(new_user)
     
     # Convert to response format
-    return UserResponse(
-        id=new_user.id,
-        email=new_user.email,
-        name=new_user.name,
-        role=new_user.role,
-        is_active=new_user.is_active,
-        skills=json.loads(new_user.skills_json),
-        learning_progress=json.loads(new_user.learning_progress_json),
-        created_at=new_user.created_at,
-        last_active=new_user.last_active
-    )
+    return _user_response(new_user)
 
 @router.post("/login", response_model=LoginResponse)
 async def login_user(
@@ -86,25 +89,20 @@ async def login_user(
         expires_delta=access_token_expires
     )
     
-    # Create session
-    await AuthService.create_user_session(db, user, access_token)
-    
-    # Update last active
-    user.last_active = user.created_at  # Will be updated by SQLAlchemy
+    # Create session and update last active in a single transaction
+    await AuthService.create_user_session(db, user, access_token, commit=False)
+    result = await db.execute(
+        update(User)
+        .where(User.id == user.id)
+        .values(last_active=func.now())
+        .returning(User.last_active)
+        .execution_options(synchronize_session=False)
+    )
+    set_committed_value(user, "last_active", result.scalar_one())
     await db.commit()
     
     # Return response
-    user_response = UserResponse(
-        id=user.id,
-        email=user.email,
-        name=user.name,
-        role=user.role,
-        is_active=user.is_active,
-        skills=json.loads(user.skills_json),
-        learning_progress=json.loads(user.learning_progress_json),
-        created_at=user.created_at,
-        last_active=user.last_active
-    )
+    user_response = _user_response(user)
     
     return LoginResponse(
         access_token=access_token,
@@ -115,11 +113,10 @@ async def login_user(
 
 @router.post("/logout", response_model=MessageResponse)
 async def logout_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
+    token: str = Depends(get_bearer_token),
     db: AsyncSession = Depends(get_db)
 ):
     """Logout user and revoke session"""
-    token = credentials.credentials
     success = await AuthService.revoke_session(db, token)
     
     if not success:
@@ -135,22 +132,13 @@ async def get_current_user_info(
     current_user: User = Depends(get_current_active_user)
 ):
     """Get current user information"""
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        name=current_user.name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-        skills=json.loads(current_user.skills_json),
-        learning_progress=json.loads(current_user.learning_progress_json),
-        created_at=current_user.created_at,
-        last_active=current_user.last_active
-    )
+    return _user_response(current_user)
 
 @router.put("/me", response_model=UserResponse)
 async def update_current_user(
     user_update: UserUpdateRequest,
     current_user: User = Depends(get_current_active_user),
+    token: str = Depends(get_bearer_token),
     db: AsyncSession = Depends(get_db)
 ):
     """Update current user information"""
@@ -162,29 +150,20 @@ async def update_current_user(
         current_user.role = user_update.role.value
     
     if user_update.skills is not None:
-        current_user.skills_json = json.dumps(user_update.skills)
+        current_user.skills = user_update.skills
     
     if user_update.learning_progress is not None:
-        current_user.learning_progress_json = json.dumps(user_update.learning_progress)
+        current_user.learning_progress = user_update.learning_progress
     
     await db.commit()
     await db.refresh(current_user)
+    AuthService.forget_cached_user(token)
     
-    return UserResponse(
-        id=current_user.id,
-        email=current_user.email,
-        name=current_user.name,
-        role=current_user.role,
-        is_active=current_user.is_active,
-        skills=json.loads(current_user.skills_json),
-        learning_progress=json.loads(current_user.learning_progress_json),
-        created_at=current_user.created_at,
-        last_active=current_user.last_active
-    )
+    return _user_response(current_user)
 
 @router.get("/verify", response_model=MessageResponse)
 async def verify_token(
-    current_user: User = Depends(get_current_active_user)
+    claims: dict = Depends(get_current_token_claims)
 ):
     """Verify if token is valid"""
     return MessageResponse(message="Token is valid")
\ No newline at end of file
@@ -1,15 +1,15 @@
 """
 MCP service management API endpoints.
 """
-import json
+import asyncio
 import logging
-from datetime import datetime
 from typing import List, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status
+from pydantic import TypeAdapter
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, insert, update, delete
 
 from ..models.database import get_db
 from ..models.mcp import (
@@ -27,6 +27,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/mcp", tags=["MCP Services"])
 
+# Batch serializers for list endpoints
+_REPO_LIST_ADAPTER = TypeAdapter(List[RepositoryData])
+_PROJECT_LIST_ADAPTER = TypeAdapter(List[ProjectData])
+
 # Register MCP client classes
 mcp_manager.register_client_class(MCPServiceType.GITHUB, GitHubMCPClient)
 mcp_manager.register_client_class(MCPServiceType.GITLAB, GitLabMCPClient)
@@ -34,36 +38,33 @@ mcp_manager.register_client_class(MCPServiceType.JIRA, JiraMCPClient)
 mcp_manager.register_client_class(MCPServiceType.AZURE_DEVOPS, AzureDevOpsMCPClient)
 
 
-@router.get("/services", response_model=List[dict])
+@router.get("/services")
 async def list_mcp_services(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
 ):
     """List all configured MCP services."""
     try:
-        result = await db.execute(select(MCPService))
-        services = result.scalars().all()
-        
-        service_list = []
-        for service in services:
-            service_dict = {
-                "id": service.id,
-                "service_type": service.service_type,
-                "name": service.name,
-                "endpoint": service.endpoint,
-                "enabled": service.enabled,
-                "status": service.status,
-                "last_connected": service.last_connected,
-                "last_error": service.last_error,
-                "created_at": service.created_at,
-                "updated_at": service.updated_at
-            }
-            service_list.append(service_dict)
-        
-        return service_list
+        result = await db.execute(
+            select(
+                MCPService.id,
+                MCPService.service_type,
+                MCPService.name,
+                MCPService.endpoint,
+                MCPService.enabled,
+                MCPService.status,
+                MCPService.last_connected,
+                MCPService.last_error,
+                MCPService.created_at,
+                MCPService.updated_at
+            )
+        )
+        
+        keys = tuple(result.keys())
+        return [dict(zip(keys, row)) for row in result.all()]
         
     except Exception as e:
-        logger.error(f"Failed to list MCP services: {e}")
+        logger.exception("Failed to list MCP services")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list MCP services"
@@ -79,12 +80,8 @@ async def create_mcp_service(
     """Create a new MCP service configuration."""
     try:
         # Validate credentials before saving
-        client = await mcp_manager.create_client(config)
-        
         try:
-            await client.connect()
-            is_valid = await client.validate_credentials()
-            await client.disconnect()
+            is_valid = await mcp_manager.validate_config(config)
             
             if not is_valid:
                 raise HTTPException(
@@ -97,36 +94,38 @@ async def create_mcp_service(
                 detail=f"Failed to validate service: {e}"
             )
         
-        # Create service record
-        service_id = str(uuid4())
-        service = MCPService(
-            id=service_id,
-            service_type=config.service_type.value,
-            name=config.name,
-            endpoint=config.endpoint,
-            credentials_json=json.dumps(config.credentials),
-            enabled=config.enabled,
-            rate_limits_json=json.dumps(config.rate_limits),
-            timeout=config.timeout,
-            retry_attempts=config.retry_attempts,
-            status=MCPConnectionStatus.DISCONNECTED.value
+        # Create service record in a single INSERT ... RETURNING round trip
+        result = await db.execute(
+            insert(MCPService)
+            .values(
+                id=str(uuid4()),
+                service_type=config.service_type,
+                name=config.name,
+                endpoint=config.endpoint,
+                credentials_json=config.credentials,
+                enabled=config.enabled,
+                rate_limits_json=config.rate_limits,
+                timeout=config.timeout,
+                retry_attempts=config.retry_attempts,
+                status=MCPConnectionStatus.DISCONNECTED.value
+            )
+            .returning(MCPService.id)
         )
-        
-        db.add(service)
+        service_id = result.scalar_one()
         await db.commit()
-        await db.refresh(service)
+        mcp_manager.invalidate_services_cache()
         
-        logger.info(f"Created MCP service: {service.name} ({service.service_type})")
+        logger.info("Created MCP service: %s (%s)", config.name, config.service_type)
         
         return {
-            "id": service.id,
+            "id": service_id,
             "message": "MCP service created successfully"
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to create MCP service: {e}")
+        logger.exception("Failed to create MCP service")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to create MCP service"
@@ -163,7 +162,7 @@ async def get_mcp_service(
             "last_error": service.last_error,
             "created_at": service.created_at,
             "updated_at": service.updated_at,
-            "rate_limits": json.loads(service.rate_limits_json or "{}"),
+            "rate_limits": service.rate_limits_json or {},
             "timeout": service.timeout,
             "retry_attempts": service.retry_attempts
         }
@@ -171,7 +170,7 @@ async def get_mcp_service(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get MCP service {service_id}: {e}")
+        logger.exception("Failed to get MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get MCP service"
@@ -187,25 +186,26 @@ async def update_mcp_service(
 ):
     """Update an existing MCP service configuration."""
     try:
-        # Check if service exists
-        result = await db.execute(
-            select(MCPService).where(MCPService.id == service_id)
-        )
-        service = result.scalar_one_or_none()
+        # Validate new credentials while checking that the service exists
+        validation = asyncio.create_task(mcp_manager.validate_config(config))
         
-        if not service:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="MCP service not found"
+        try:
+            result = await db.execute(
+                select(MCPService.id).where(MCPService.id == service_id)
             )
-        
-        # Validate new credentials
-        client = await mcp_manager.create_client(config)
+            
+            if result.scalar_one_or_none() is None:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail="MCP service not found"
+                )
+        except BaseException:
+            validation.cancel()
+            await asyncio.gather(validation, return_exceptions=True)
+            raise
         
         try:
-            await client.connect()
-            is_valid = await client.validate_credentials()
-            await client.disconnect()
+            is_valid = await validation
             
             if not is_valid:
                 raise HTTPException(
@@ -226,28 +226,28 @@ async def update_mcp_service(
             update(MCPService)
             .where(MCPService.id == service_id)
             .values(
-                service_type=config.service_type.value,
+                service_type=config.service_type,
                 name=config.name,
                 endpoint=config.endpoint,
-                credentials_json=json.dumps(config.credentials),
+                credentials_json=config.credentials,
                 enabled=config.enabled,
-                rate_limits_json=json.dumps(config.rate_limits),
+                rate_limits_json=config.rate_limits,
                 timeout=config.timeout,
                 retry_attempts=config.retry_attempts,
-                status=MCPConnectionStatus.DISCONNECTED.value,
-                updated_at=datetime.utcnow()
+                status=MCPConnectionStatus.DISCONNECTED.value
             )
         )
         await db.commit()
+        mcp_manager.invalidate_services_cache()
         
-        logger.info(f"Updated MCP service: {service_id}")
+        logger.info("Updated MCP service: %s", service_id)
         
         return {"message": "MCP service updated successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to update MCP service {service_id}: {e}")
+        logger.exception("Failed to update MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update MCP service"
@@ -277,15 +277,17 @@ async def delete_mcp_service(
             )
         
         await db.commit()
+        mcp_manager.invalidate_services_cache()
+        mcp_manager.forget_service_health(service_id)
         
-        logger.info(f"Deleted MCP service: {service_id}")
+        logger.info("Deleted MCP service: %s", service_id)
         
         return {"message": "MCP service deleted successfully"}
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to delete MCP service {service_id}: {e}")
+        logger.exception("Failed to delete MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete MCP service"
@@ -315,7 +317,7 @@ async def connect_mcp_service(
             detail=str(e)
         )
     except Exception as e:
-        logger.error(f"Failed to connect MCP service {service_id}: {e}")
+        logger.exception("Failed to connect MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to connect to MCP service"
@@ -333,7 +335,7 @@ async def disconnect_mcp_service(
         return {"message": "Successfully disconnected from MCP service"}
         
     except Exception as e:
-        logger.error(f"Failed to disconnect MCP service {service_id}: {e}")
+        logger.exception("Failed to disconnect MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to disconnect from MCP service"
@@ -359,8 +361,8 @@ async def health_check_mcp_service(
         
         return {
             "service_id": health_check.service_id,
-            "service_type": health_check.service_type.value,
-            "status": health_check.status.value,
+            "service_type": health_check.service_type,
+            "status": health_check.status,
             "response_time_ms": health_check.response_time_ms,
             "error_message": health_check.error_message,
             "checked_at": health_check.checked_at
@@ -369,7 +371,7 @@ async def health_check_mcp_service(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Health check failed for MCP service {service_id}: {e}")
+        logger.exception("Health check failed for MCP service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Health check failed"
@@ -395,14 +397,14 @@ async def list_service_repositories(
         repositories = await client.list_repositories(limit)
         
         return {
-            "repositories": [repo.dict() for repo in repositories],
+            "repositories": _REPO_LIST_ADAPTER.dump_python(repositories, mode="json"),
             "total": len(repositories)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list repositories for service {service_id}: {e}")
+        logger.exception("Failed to list repositories for service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list repositories"
@@ -428,14 +430,14 @@ async def list_service_projects(
         projects = await client.list_projects(limit)
         
         return {
-            "projects": [project.dict() for project in projects],
+            "projects": _PROJECT_LIST_ADAPTER.dump_python(projects, mode="json"),
             "total": len(projects)
         }
         
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to list projects for service {service_id}: {e}")
+        logger.exception("Failed to list projects for service %s", service_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list projects"
@@ -451,12 +453,12 @@ async def sync_all_services(
         results = await mcp_manager.sync_all_services()
         
         return {
-            "sync_results": [result.dict() for result in results],
+            "sync_results": [result.model_dump(mode="json") for result in results],
             "total_services": len(results)
         }
         
     except Exception as e:
-        logger.error(f"Failed to sync MCP services: {e}")
+        logger.exception("Failed to sync MCP services")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to sync MCP services"
@@ -472,22 +474,12 @@ async def health_check_all_services(
         health_checks = await mcp_manager.health_check_all()
         
         return {
-            "health_checks": [
-                {
-                    "service_id": check.service_id,
-                    "service_type": check.service_type.value,
-                    "status": check.status.value,
-                    "response_time_ms": check.response_time_ms,
-                    "error_message": check.error_message,
-                    "checked_at": check.checked_at
-                }
-                for check in health_checks
-            ],
+            "health_checks": [check.model_dump(mode="json") for check in health_checks],
             "total_services": len(health_checks)
         }
         
     except Exception as e:
-        logger.error(f"Failed to perform health checks: {e}")
+        logger.exception("Failed to perform health checks")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to perform health checks"
@@ -1,20 +1,24 @@
 """
 Project Management API endpoints.
 """
+import asyncio
 import logging
 from typing import List, Optional
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from ..models.database import get_db
+from ..models.database import get_db, AsyncSessionLocal
 from ..models.project_management import (
     ProjectOverviewResponse, ProjectAnalyticsResponse, ProjectSyncStatus,
     WorkItemResponse, TeamMemberResponse
 )
 from ..services.project_management import ProjectManagementService
+from ..services.response_cache import cached_response
+from ..utils import json_dumps
 from ..services.auth import get_current_active_user
 from ..models.user import User
 
@@ -23,6 +27,13 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/project-management", tags=["Project Management"])
 
+# Upper bound on concurrent outbound calls during /sync-all
+SYNC_CONCURRENCY = 10
+
+# Batch encoders for list endpoints; models are dumped to JSON in pydantic-core
+_WORK_ITEM_LIST_ADAPTER = TypeAdapter(List[WorkItemResponse])
+_TEAM_MEMBER_LIST_ADAPTER = TypeAdapter(List[TeamMemberResponse])
+
 
 class SyncProjectRequest(BaseModel):
     """Request model for syncing project data."""
@@ -42,6 +53,7 @@ class ProjectDashboardResponse(BaseModel):
 
 
 @router.get("/dashboard", response_model=ProjectDashboardResponse)
+@cached_response(ttl=15)
 async def get_project_dashboard(
     current_user: User = Depends(get_current_active_user),
     db: AsyncSession = Depends(get_db)
@@ -49,35 +61,16 @@ async def get_project_dashboard(
     """Get project management dashboard overview."""
     try:
         pm_service = ProjectManagementService(db)
-        projects = await pm_service.list_projects()
-        
-        # Calculate dashboard metrics
-        total_projects = len(projects)
-        active_projects = len([p for p in projects if p.status.lower() in ['active', 'wellformed']])
-        total_work_items = sum(p.total_work_items for p in projects)
-        completed_work_items = sum(p.completed_work_items for p in projects)
-        in_progress_work_items = sum(p.in_progress_work_items for p in projects)
-        active_team_members = sum(p.active_team_members for p in projects)
-        
-        # Get recent projects (last 5)
-        recent_projects = sorted(
-            projects, 
-            key=lambda x: x.last_synced or x.updated_at, 
-            reverse=True
-        )[:5]
+        metrics = await pm_service.get_dashboard_metrics()
+        recent_projects = await pm_service.list_recent_projects(limit=5)
         
         return ProjectDashboardResponse(
-            total_projects=total_projects,
-            active_projects=active_projects,
-            total_work_items=total_work_items,
-            completed_work_items=completed_work_items,
-            in_progress_work_items=in_progress_work_items,
-            active_team_members=active_team_members,
+            **metrics,
             recent_projects=recent_projects
         )
         
     except Exception as e:
-        logger.error(f"Failed to get project dashboard: {e}")
+        logger.exception("Failed to get project dashboard")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get project dashboard"
@@ -97,7 +90,7 @@ async def list_projects(
         return projects
         
     except Exception as e:
-        logger.error(f"Failed to list projects: {e}")
+        logger.exception("Failed to list projects")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list projects"
@@ -126,7 +119,7 @@ async def get_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get project {project_id}: {e}")
+        logger.exception("Failed to get project %s", project_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get project"
@@ -155,7 +148,7 @@ async def get_project_analytics(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get project analytics for {project_id}: {e}")
+        logger.exception("Failed to get project analytics for %s", project_id)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get project analytics"
@@ -187,7 +180,7 @@ async def sync_project(
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to sync project: {e}")
+        logger.exception("Failed to sync project")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to sync project"
@@ -207,61 +200,100 @@ async def sync_all_projects(
         
         # Get all enabled MCP services
         result = await db.execute(
-            select(MCPService).where(MCPService.enabled == True)
+            select(MCPService.id, MCPService.name).where(MCPService.enabled == True)
         )
-        services = result.scalars().all()
         
-        sync_results = []
-        pm_service = ProjectManagementService(db)
+        services = result.all()
         
-        for service in services:
-            try:
-                # Get connected client
-                client = await mcp_manager.get_client(service.id)
-                if not client:
-                    logger.warning(f"Service {service.name} not connected, skipping")
-                    continue
-                
-                # List projects from the service
-                projects = await client.list_projects(limit=50)
-                
-                for project_data in projects:
-                    try:
-                        sync_status = await pm_service.sync_project_data(
-                            service.id,
-                            project_data.key or project_data.id
-                        )
-                        sync_results.append(sync_status)
-                        
-                    except Exception as e:
-                        logger.error(f"Failed to sync project {project_data.name}: {e}")
-                        sync_results.append(ProjectSyncStatus(
-                            project_id="",
-                            service_id=service.id,
-                            last_synced=None,
-                            sync_status="error",
-                            work_items_synced=0,
-                            team_members_synced=0,
-                            workflows_synced=0,
-                            errors=[str(e)]
-                        ))
-                        
-            except Exception as e:
-                logger.error(f"Failed to sync from service {service.name}: {e}")
+        # Resolve every service's client up front
+        clients = await asyncio.gather(
+            *(mcp_manager.get_client(service_id) for service_id, _ in services)
+        )
+        
+        connected = []
+        for (service_id, service_name), client in zip(services, clients):
+            if not client:
+                logger.warning("Service %s not connected, skipping", service_name)
+                continue
+            connected.append((service_id, service_name, client))
+        
+        semaphore = asyncio.Semaphore(SYNC_CONCURRENCY)
         
-        successful_syncs = len([r for r in sync_results if r.sync_status == "success"])
-        failed_syncs = len([r for r in sync_results if r.sync_status == "error"])
+        async def list_service_projects(client):
+            async with semaphore:
+                return await client.list_projects(limit=50)
         
-        return {
-            "message": f"Sync completed: {successful_syncs} successful, {failed_syncs} failed",
-            "total_synced": len(sync_results),
-            "successful": successful_syncs,
-            "failed": failed_syncs,
-            "results": [result.dict() for result in sync_results]
-        }
+        async def sync_one(service_id, project_data):
+            project_identifier = project_data.key or project_data.id
+            try:
+                # Each sync commits independently, so it needs its own session
+                async with semaphore, AsyncSessionLocal() as session:
+                    return await ProjectManagementService(session).sync_project_data(
+                        service_id,
+                        project_identifier
+                    )
+            except Exception as e:
+                logger.error("Failed to sync project %s: %s", project_data.name, e)
+                return ProjectSyncStatus(
+                    project_id=project_identifier,
+                    service_id=service_id,
+                    last_synced=None,
+                    sync_status="error",
+                    work_items_synced=0,
+                    team_members_synced=0,
+                    workflows_synced=0,
+                    errors=[str(e)]
+                )
+        
+        async def stream_results():
+            # List projects from every service concurrently
+            listings = await asyncio.gather(
+                *(list_service_projects(client) for _, _, client in connected),
+                return_exceptions=True
+            )
+            
+            tasks = []
+            for (service_id, service_name, _), projects in zip(connected, listings):
+                if isinstance(projects, Exception):
+                    logger.error("Failed to sync from service %s: %s", service_name, projects)
+                    continue
+                tasks.extend(
+                    asyncio.ensure_future(sync_one(service_id, project_data))
+                    for project_data in projects
+                )
+            
+            # Emit one NDJSON line per project as its sync finishes, then a summary line
+            successful_syncs = failed_syncs = 0
+            try:
+                for next_result in asyncio.as_completed(tasks):
+                    sync_status = await next_result
+                    if sync_status.sync_status == "success":
+                        successful_syncs += 1
+                    elif sync_status.sync_status == "error":
+                        failed_syncs += 1
+                    yield json_dumps(sync_status.model_dump(mode="json")) + "\n"
+            finally:
+                for task in tasks:
+                    task.cancel()
+            
+            yield json_dumps({
+                "message": f"Sync completed: {successful_syncs} successful, {failed_syncs} failed",
+                "total_synced": len(tasks),
+                "successful": successful_syncs,
+                "failed": failed_syncs
+            }) + "\n"
+        
+        # GZipMiddleware passes through responses that already declare a Content-Encoding.
+        # Declaring identity keeps it from compressing this stream, because the compressor
+        # would hold each line in its buffer until enough output built up to flush.
+        return StreamingResponse(
+            stream_results(),
+            media_type="application/x-ndjson",
+            headers={"Content-Encoding": "identity"}
+        )
         
     except Exception as e:
-        logger.error(f"Failed to sync all projects: {e}")
+        logger.exception("Failed to sync all projects")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to sync all projects"
@@ -279,17 +311,32 @@ async def list_work_items(
 ):
     """List work items with optional filters."""
     try:
-        from sqlalchemy import select
+        from sqlalchemy import select, func
         from ..models.project_management import WorkItem
-        import json
         
-        query = select(WorkItem)
+        query = select(
+            WorkItem.id,
+            WorkItem.external_id,
+            WorkItem.title,
+            WorkItem.description,
+            WorkItem.item_type,
+            WorkItem.status,
+            WorkItem.priority,
+            WorkItem.assignee,
+            WorkItem.reporter,
+            WorkItem.story_points,
+            WorkItem.labels_json.label("labels"),
+            WorkItem.url,
+            WorkItem.created_at,
+            WorkItem.updated_at,
+            WorkItem.resolved_at
+        )
         
         if project_id:
             query = query.where(WorkItem.project_id == project_id)
         
         if status:
-            query = query.where(WorkItem.status.ilike(f"%{status}%"))
+            query = query.where(func.lower(WorkItem.status) == status.lower())
         
         if assignee:
             query = query.where(WorkItem.assignee.ilike(f"%{assignee}%"))
@@ -297,39 +344,15 @@ async def list_work_items(
         query = query.order_by(WorkItem.updated_at.desc()).limit(limit)
         
         result = await db.execute(query)
-        work_items = result.scalars().all()
-        
-        work_item_responses = []
-        for item in work_items:
-            labels = []
-            if item.labels_json:
-                try:
-                    labels = json.loads(item.labels_json)
-                except:
-                    pass
-            
-            work_item_responses.append(WorkItemResponse(
-                id=item.id,
-                external_id=item.external_id,
-                title=item.title,
-                description=item.description,
-                item_type=item.item_type,
-                status=item.status,
-                priority=item.priority,
-                assignee=item.assignee,
-                reporter=item.reporter,
-                story_points=item.story_points,
-                labels=labels,
-                url=item.url,
-                created_at=item.created_at,
-                updated_at=item.updated_at,
-                resolved_at=item.resolved_at
-            ))
-        
-        return work_item_responses
+        work_items = [WorkItemResponse.from_trusted(**row._mapping) for row in result]
+        
+        return Response(
+            content=_WORK_ITEM_LIST_ADAPTER.dump_json(work_items),
+            media_type="application/json"
+        )
         
     except Exception as e:
-        logger.error(f"Failed to list work items: {e}")
+        logger.exception("Failed to list work items")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list work items"
@@ -348,7 +371,15 @@ async def list_team_members(
         from sqlalchemy import select
         from ..models.project_management import TeamMember
         
-        query = select(TeamMember)
+        query = select(
+            TeamMember.id,
+            TeamMember.external_id,
+            TeamMember.name,
+            TeamMember.email,
+            TeamMember.role,
+            TeamMember.team,
+            TeamMember.is_active
+        )
         
         if project_id:
             query = query.where(TeamMember.project_id == project_id)
@@ -359,23 +390,15 @@ async def list_team_members(
         query = query.order_by(TeamMember.name)
         
         result = await db.execute(query)
-        team_members = result.scalars().all()
-        
-        return [
-            TeamMemberResponse(
-                id=member.id,
-                external_id=member.external_id,
-                name=member.name,
-                email=member.email,
-                role=member.role,
-                team=member.team,
-                is_active=member.is_active
-            )
-            for member in team_members
-        ]
+        team_members = [TeamMemberResponse.from_trusted(**row._mapping) for row in result]
+        
+        return Response(
+            content=_TEAM_MEMBER_LIST_ADAPTER.dump_json(team_members),
+            media_type="application/json"
+        )
         
     except Exception as e:
-        logger.error(f"Failed to list team members: {e}")
+        logger.exception("Failed to list team members")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to list team members"
@@ -383,6 +406,7 @@ async def list_team_members(
 
 
 @router.get("/insights/workflow-analysis")
+@cached_response(ttl=60)
 async def get_workflow_analysis(
     project_id: Optional[str] = Query(None, description="Filter by project ID"),
     current_user: User = Depends(get_current_active_user),
@@ -392,9 +416,16 @@ async def get_workflow_analysis(
     try:
         from sqlalchemy import select
         from ..models.project_management import ProjectAnalytics
-        import json
         
-        query = select(ProjectAnalytics)
+        query = select(
+            ProjectAnalytics.project_id,
+            ProjectAnalytics.analysis_date,
+            ProjectAnalytics.workflow_patterns_json,
+            ProjectAnalytics.communication_patterns_json,
+            ProjectAnalytics.active_team_members,
+            ProjectAnalytics.avg_completion_time_days,
+            ProjectAnalytics.velocity_story_points
+        )
         
         if project_id:
             query = query.where(ProjectAnalytics.project_id == project_id)
@@ -402,45 +433,30 @@ async def get_workflow_analysis(
         query = query.order_by(ProjectAnalytics.analysis_date.desc())
         
         result = await db.execute(query)
-        analytics_list = result.scalars().all()
-        
-        workflow_insights = []
         
-        for analytics in analytics_list:
-            workflow_patterns = {}
-            communication_patterns = {}
-            
-            if analytics.workflow_patterns_json:
-                try:
-                    workflow_patterns = json.loads(analytics.workflow_patterns_json)
-                except:
-                    pass
-            
-            if analytics.communication_patterns_json:
-                try:
-                    communication_patterns = json.loads(analytics.communication_patterns_json)
-                except:
-                    pass
-            
-            workflow_insights.append({
-                "project_id": analytics.project_id,
-                "analysis_date": analytics.analysis_date,
-                "workflow_patterns": workflow_patterns,
-                "communication_patterns": communication_patterns,
+        workflow_insights = [
+            {
+                "project_id": row.project_id,
+                "analysis_date": row.analysis_date,
+                "workflow_patterns": row.workflow_patterns_json or {},
+                "communication_patterns": row.communication_patterns_json or {},
                 "team_metrics": {
-                    "active_members": analytics.active_team_members,
-                    "avg_completion_time_days": analytics.avg_completion_time_days,
-                    "velocity_story_points": analytics.velocity_story_points
+                    "active_members": row.active_team_members,
+                    "avg_completion_time_days": row.avg_completion_time_days,
+                    "velocity_story_points": row.velocity_story_points
                 }
-            })
+            }
+            for row in result.all()
+        ]
         
-        return {
+        # Raw dicts with datetimes: hand them to orjson directly, skipping jsonable_encoder
+        return ORJSONResponse(content={
             "total_projects_analyzed": len(workflow_insights),
             "insights": workflow_insights
-        }
+        })
         
     except Exception as e:
-        logger.error(f"Failed to get workflow analysis: {e}")
+        logger.exception("Failed to get workflow analysis")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to get workflow analysis"
@@ -14,6 +14,11 @@ class Settings(BaseSettings):
     
     # Database Configuration
     database_url: str = "sqlite+aiosqlite:///./rampforge.db"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+    auto_create_tables: bool = True
     
     # Redis Configuration
     redis_url: str = "redis://localhost:6379"
@@ -22,6 +27,8 @@ class Settings(BaseSettings):
     secret_key: str = "your-secret-key-change-in-production"
     algorithm: str = "HS256"
     access_token_expire_minutes: int = 30
+    bcrypt_rounds: int = 12
+    session_sweep_interval_seconds: int = 300  # 0 disables the expired-session sweep
     
     # External Services
     github_token: Optional[str] = None
@@ -1,13 +1,18 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
+import asyncio
 import uvicorn
 from datetime import datetime
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 # Import configuration and models
 from .config import settings
 from .models import create_tables
+from .services.response_cache import init_response_cache, close_response_cache
+from .services.auth import sweep_expired_sessions
+from .services.mcp_client import mcp_manager
 from .api import auth_router
 from .api.mcp import router as mcp_router
 from .api.project_management import router as pm_router
@@ -15,10 +20,24 @@ from .api.project_management import router as pm_router
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager"""
-    # Startup: Create database tables
-    await create_tables()
+    # Startup: Create database tables (unless disabled), the response cache client
+    # and the expired-session sweeper
+    if settings.auto_create_tables:
+        await create_tables()
+    await init_response_cache()
+    session_sweeper = None
+    if settings.session_sweep_interval_seconds > 0:
+        session_sweeper = asyncio.create_task(
+            sweep_expired_sessions(settings.session_sweep_interval_seconds)
+        )
     yield
-    # Shutdown: cleanup if needed
+    # Shutdown: stop the sweeper, close MCP connections and the response cache client
+    if session_sweeper is not None:
+        session_sweeper.cancel()
+        with suppress(asyncio.CancelledError):
+            await session_sweeper
+    await mcp_manager.aclose()
+    await close_response_cache()
 
 # Create FastAPI app
 app = FastAPI(
@@ -27,6 +46,7 @@ app = FastAPI(
     version=settings.api_version,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -41,6 +61,9 @@ app.add_middleware(
     expose_headers=["*"],
 )
 
+# Compress larger JSON responses; level 5 keeps CPU cost low for most of the size win
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=5)
+
 # Include API routers
 app.include_router(auth_router)
 app.include_router(mcp_router)
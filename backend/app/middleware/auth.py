@@ -1,11 +1,10 @@
 from fastapi import Request, HTTPException, status
 from fastapi.security.utils import get_authorization_scheme_param
 from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.responses import JSONResponse
-from sqlalchemy.ext.asyncio import AsyncSession
-from ..models import get_db
+from fastapi.responses import ORJSONResponse
+from ..models import AsyncSessionLocal
 from ..services.auth import AuthService
-import json
+import re
 from datetime import datetime
 
 class AuthMiddleware(BaseHTTPMiddleware):
@@ -22,6 +21,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
             "/api/v1/chat",
             "/api/v1/learning"
         ]
+        self._protected_re = re.compile(
+            "|".join(re.escape(protected_path) for protected_path in self.protected_paths)
+        )
     
     async def dispatch(self, request: Request, call_next):
         """Process request through authentication middleware"""
@@ -43,11 +45,11 @@ class AuthMiddleware(BaseHTTPMiddleware):
         if not token:
             return self._unauthorized_response("Missing token")
         
-        # Validate token and get user
+        # Validate token and get user (recently resolved tokens skip the database)
         try:
-            # Get database session
-            async with AsyncSession(bind=request.app.state.db_engine) as db:
-                user = await AuthService.get_user_by_token(db, token)
+            # Get database session from the shared, pooled session factory
+            async with AsyncSessionLocal() as db:
+                user = await AuthService.get_cached_user_by_token(db, token)
                 if not user:
                     return self._unauthorized_response("Invalid or expired token")
                 
@@ -61,11 +63,11 @@ class AuthMiddleware(BaseHTTPMiddleware):
     
     def _is_protected_path(self, path: str) -> bool:
         """Check if path requires authentication"""
-        return any(path.startswith(protected_path) for protected_path in self.protected_paths)
+        return self._protected_re.match(path) is not None
     
-    def _unauthorized_response(self, detail: str) -> JSONResponse:
+    def _unauthorized_response(self, detail: str) -> ORJSONResponse:
         """Return unauthorized response"""
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={
                 "error": True,
@@ -1,15 +1,44 @@
+import warnings
+
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
-from sqlalchemy import MetaData
+from sqlalchemy import DateTime, MetaData, JSON, event, inspect, make_url, text
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import FunctionElement
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.exc import SAWarning
 from ..config import settings
+from ..utils import json_loads, json_dumps
+
+# Queue pool sizing for server databases; SQLite gets a NullPool/StaticPool
+_backend_name = make_url(settings.database_url).get_backend_name()
+_pool_options = {"pool_pre_ping": True}
+if _backend_name != "sqlite":
+    _pool_options.update(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout=settings.db_pool_timeout,
+        pool_recycle=settings.db_pool_recycle
+    )
 
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
-    future=True
+    future=True,
+    json_serializer=json_dumps,
+    json_deserializer=json_loads,
+    **_pool_options
 )
 
+if _backend_name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_sqlite_wal(dbapi_connection, connection_record):
+        """Use write-ahead logging so writes (e.g. the session sweep) don't block readers"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
 # Create async session factory
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -17,9 +46,32 @@ AsyncSessionLocal = async_sessionmaker(
     expire_on_commit=False
 )
 
+# JSON document column type: JSONB on PostgreSQL, JSON (TEXT storage) elsewhere
+JSONDocument = JSON().with_variant(JSONB(), "postgresql")
+
+class utcnow(FunctionElement):
+    """Current UTC time evaluated by the database, as a naive timestamp"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # Already UTC; CURRENT_TIMESTAMP would drop the fractional seconds
+    return "STRFTIME('%Y-%m-%d %H:%M:%f', 'now')"
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
 class Base(DeclarativeBase):
     """Base class for all database models"""
     metadata = MetaData()
+    # Read server-generated defaults back in the INSERT/UPDATE (RETURNING) rather than lazily
+    __mapper_args__ = {"eager_defaults": True}
 
 async def get_db():
     """Dependency to get database session"""
@@ -29,10 +81,50 @@ async def get_db():
         finally:
             await session.close()
 
+# Advisory lock key serializing schema creation across workers on PostgreSQL
+_CREATE_TABLES_LOCK_KEY = 727_001
+
 async def create_tables():
     """Create all database tables"""
     async with engine.begin() as conn:
+        if conn.dialect.name == "postgresql":
+            # Held until commit, so concurrent workers wait and then find the tables present
+            await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": _CREATE_TABLES_LOCK_KEY})
+            # Required by the trigram indexes
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+        await _add_work_item_key(conn)
+
+async def _add_work_item_key(conn):
+    """Add the (project_id, external_id) unique index to work_items tables created before it.
+
+    create_all never alters existing tables, and the work item upsert's ON CONFLICT target
+    fails without this index. Duplicate keys are collapsed first, keeping the most recently
+    updated row.
+    """
+    def has_key(sync_conn):
+        # Expression indexes on work_items can't be reflected; only the names matter here
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", SAWarning)
+            indexes = inspect(sync_conn).get_indexes("work_items")
+        return any(index["name"] == "uq_work_items_project_external" for index in indexes)
+
+    if await conn.run_sync(has_key):
+        return
+
+    await conn.execute(text(
+        "DELETE FROM work_items WHERE id IN ("
+        " SELECT id FROM ("
+        "  SELECT id, ROW_NUMBER() OVER ("
+        "   PARTITION BY project_id, external_id"
+        "   ORDER BY updated_at IS NULL, updated_at DESC, id DESC"
+        "  ) AS duplicate_rank FROM work_items"
+        " ) ranked WHERE duplicate_rank > 1"
+        ")"
+    ))
+    await conn.execute(text(
+        "CREATE UNIQUE INDEX uq_work_items_project_external ON work_items (project_id, external_id)"
+    ))
 
 async def drop_tables():
     """Drop all database tables (for testing)"""
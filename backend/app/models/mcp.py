@@ -4,11 +4,11 @@ MCP (Model Context Protocol) data models and schemas.
 from datetime import datetime
 from enum import Enum
 from typing import Dict, List, Optional, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from sqlalchemy import Column, String, DateTime, Boolean, Text, Integer
 from sqlalchemy.ext.declarative import declarative_base
 
-from .database import Base
+from .database import Base, JSONDocument, utcnow
 
 
 class MCPServiceType(str, Enum):
@@ -28,8 +28,14 @@ class MCPConnectionStatus(str, Enum):
     ERROR = "error"
 
 
+# Immutable transport models; enum fields hold their plain string values
+_TRANSPORT_MODEL_CONFIG = ConfigDict(use_enum_values=True, frozen=True)
+
+
 class MCPConfig(BaseModel):
     """MCP service configuration model."""
+    model_config = _TRANSPORT_MODEL_CONFIG
+    
     service_type: MCPServiceType
     name: str = Field(..., description="Human-readable name for the service")
     endpoint: str = Field(..., description="Service API endpoint URL")
@@ -38,11 +44,6 @@ class MCPConfig(BaseModel):
     rate_limits: Dict[str, int] = Field(default_factory=dict, description="Rate limiting configuration")
     timeout: int = Field(default=30, description="Request timeout in seconds")
     retry_attempts: int = Field(default=3, description="Number of retry attempts")
-    
-    class Config:
-        json_encoders = {
-            MCPServiceType: lambda v: v.value
-        }
 
 
 class MCPService(Base):
@@ -53,20 +54,22 @@ class MCPService(Base):
     service_type = Column(String, nullable=False)
     name = Column(String, nullable=False)
     endpoint = Column(String, nullable=False)
-    credentials_json = Column(Text, nullable=False)  # Encrypted JSON
+    credentials_json = Column(JSONDocument, nullable=False)
     enabled = Column(Boolean, default=True)
-    rate_limits_json = Column(Text, nullable=True)
+    rate_limits_json = Column(JSONDocument, nullable=True)
     timeout = Column(Integer, default=30)
     retry_attempts = Column(Integer, default=3)
     status = Column(String, default=MCPConnectionStatus.DISCONNECTED.value)
     last_connected = Column(DateTime, nullable=True)
     last_error = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
 
 
 class RepositoryData(BaseModel):
     """Repository data fetched from MCP services."""
+    model_config = _TRANSPORT_MODEL_CONFIG
+    
     id: str
     name: str
     full_name: str
@@ -85,6 +88,8 @@ class RepositoryData(BaseModel):
 
 class ProjectData(BaseModel):
     """Project management data from MCP services."""
+    model_config = _TRANSPORT_MODEL_CONFIG
+    
     id: str
     name: str
     key: str
@@ -96,10 +101,29 @@ class ProjectData(BaseModel):
     updated_at: datetime
     members: List[Dict[str, Any]] = Field(default_factory=list)
     workflows: List[Dict[str, Any]] = Field(default_factory=list)
+    
+    @classmethod
+    def from_repository(cls, repo: RepositoryData, project_type: str) -> "ProjectData":
+        """Project view of a repository."""
+        return cls(
+            id=repo.id,
+            name=repo.name,
+            key=repo.full_name,
+            description=repo.description,
+            url=repo.url,
+            project_type=project_type,
+            status="active",
+            created_at=repo.created_at,
+            updated_at=repo.updated_at,
+            members=[],  # Collaborators and workflows need further API calls
+            workflows=[]
+        )
 
 
 class SyncResult(BaseModel):
     """Result of MCP data synchronization."""
+    model_config = _TRANSPORT_MODEL_CONFIG
+    
     service_id: str
     service_type: MCPServiceType
     status: str  # success, partial, failed
@@ -112,6 +136,8 @@ class SyncResult(BaseModel):
 
 class MCPHealthCheck(BaseModel):
     """MCP service health check result."""
+    model_config = _TRANSPORT_MODEL_CONFIG
+    
     service_id: str
     service_type: MCPServiceType
     status: MCPConnectionStatus
@@ -1,13 +1,15 @@
 """
 Project Management data models for storing PM integration data.
 """
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Dict, List, Optional, Any
-from sqlalchemy import Column, String, DateTime, Text, Integer, Float, Boolean, ForeignKey
+from sqlalchemy import Column, String, DateTime, Text, Integer, Float, Boolean, ForeignKey, Index, func
 from sqlalchemy.orm import relationship
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
-from .database import Base
+from .database import Base, JSONDocument, utcnow
+from ..config import settings
 
 
 class ProjectManagementProject(Base):
@@ -23,8 +25,8 @@ class ProjectManagementProject(Base):
     url = Column(String, nullable=True)
     project_type = Column(String, nullable=False)  # jira, azure_devops
     status = Column(String, nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     last_synced = Column(DateTime, nullable=True)
     
     # Relationships
@@ -33,9 +35,22 @@ class ProjectManagementProject(Base):
     workflows = relationship("Workflow", back_populates="project", cascade="all, delete-orphan")
 
 
+# Recency ordering used for the dashboard's recent projects
+Index(
+    "ix_pm_projects_recent_activity",
+    func.coalesce(ProjectManagementProject.last_synced, ProjectManagementProject.updated_at).desc()
+)
+
+
 class WorkItem(Base):
     """Database model for work items (tickets, issues, user stories)."""
     __tablename__ = "work_items"
+    __table_args__ = (
+        Index("ix_work_items_project_updated", "project_id", "updated_at"),
+        # Conflict target for the bulk upsert in ProjectManagementService._sync_work_items;
+        # a unique index so create_tables can add it to databases created before it existed
+        Index("uq_work_items_project_external", "project_id", "external_id", unique=True),
+    )
     
     id = Column(String, primary_key=True)
     external_id = Column(String, nullable=False)
@@ -48,19 +63,35 @@ class WorkItem(Base):
     assignee = Column(String, nullable=True)
     reporter = Column(String, nullable=True)
     story_points = Column(Float, nullable=True)
-    labels_json = Column(Text, nullable=True)  # JSON array of labels
+    labels_json = Column(JSONDocument, nullable=True)  # JSON array of labels
     url = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     resolved_at = Column(DateTime, nullable=True)
     
     # Relationships
     project = relationship("ProjectManagementProject", back_populates="work_items")
 
 
+# Case-insensitive status filter used by the work item list endpoint
+Index("ix_work_items_status_lower", func.lower(WorkItem.status))
+Index("ix_work_items_project_status_lower", WorkItem.project_id, func.lower(WorkItem.status))
+
+# Trigram index so the assignee substring (ILIKE) filter can use an index on PostgreSQL
+Index(
+    "ix_work_items_assignee_trgm",
+    WorkItem.assignee,
+    postgresql_using="gin",
+    postgresql_ops={"assignee": "gin_trgm_ops"}
+).ddl_if(dialect="postgresql")
+
+
 class TeamMember(Base):
     """Database model for project team members."""
     __tablename__ = "team_members"
+    __table_args__ = (
+        Index("ix_team_members_project_active_name", "project_id", "is_active", "name"),
+    )
     
     id = Column(String, primary_key=True)
     project_id = Column(String, ForeignKey("pm_projects.id"), nullable=False)
@@ -70,8 +101,8 @@ class TeamMember(Base):
     role = Column(String, nullable=True)
     team = Column(String, nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
+    updated_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow(), onupdate=datetime.utcnow)
     
     # Relationships
     project = relationship("ProjectManagementProject", back_populates="team_members")
@@ -89,7 +120,7 @@ class Workflow(Base):
     order_index = Column(Integer, nullable=True)
     is_initial = Column(Boolean, default=False)
     is_final = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     
     # Relationships
     project = relationship("ProjectManagementProject", back_populates="workflows")
@@ -98,10 +129,13 @@ class Workflow(Base):
 class ProjectAnalytics(Base):
     """Database model for project analytics and insights."""
     __tablename__ = "project_analytics"
+    __table_args__ = (
+        Index("ix_project_analytics_project_date", "project_id", "analysis_date"),
+    )
     
     id = Column(String, primary_key=True)
     project_id = Column(String, ForeignKey("pm_projects.id"), nullable=False)
-    analysis_date = Column(DateTime, default=datetime.utcnow)
+    analysis_date = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
     
     # Metrics
     total_work_items = Column(Integer, default=0)
@@ -115,14 +149,25 @@ class ProjectAnalytics(Base):
     velocity_story_points = Column(Float, nullable=True)
     
     # Communication patterns (JSON)
-    communication_patterns_json = Column(Text, nullable=True)
-    workflow_patterns_json = Column(Text, nullable=True)
+    communication_patterns_json = Column(JSONDocument, nullable=True)
+    workflow_patterns_json = Column(JSONDocument, nullable=True)
     
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, default=datetime.utcnow, server_default=utcnow())
 
 
 # Pydantic models for API responses
-class ProjectOverviewResponse(BaseModel):
+class TrustedResponseModel(BaseModel):
+    """Response model hydrated from data that was validated when it was written."""
+    
+    @classmethod
+    def from_trusted(cls, **values):
+        """Build without re-running validation; validation stays on in debug mode."""
+        if settings.debug:
+            return cls.model_validate(values)
+        return cls.model_construct(**values)
+
+
+class ProjectOverviewResponse(TrustedResponseModel):
     """Project overview response model."""
     id: str
     name: str
@@ -150,7 +195,22 @@ class ProjectOverviewResponse(BaseModel):
     recent_work_items: List[Dict[str, Any]]
 
 
-class WorkItemResponse(BaseModel):
+class TrustedDataclass:
+    """Slotted response dataclass hydrated from data that was validated when it was written."""
+    __slots__ = ()
+    
+    @classmethod
+    def from_trusted(cls, **values):
+        """Build without validation; validation stays on in debug mode."""
+        if settings.debug:
+            return TypeAdapter(cls).validate_python(values)
+        return cls(**values)
+
+
+# Row-per-instance list responses are slotted dataclasses: no per-instance __dict__
+# or pydantic field tracking, and TypeAdapter still serializes them in pydantic-core
+@dataclass(slots=True, frozen=True, kw_only=True)
+class WorkItemResponse(TrustedDataclass):
     """Work item response model."""
     id: str
     external_id: str
@@ -162,14 +222,21 @@ class WorkItemResponse(BaseModel):
     assignee: Optional[str]
     reporter: Optional[str]
     story_points: Optional[float]
-    labels: List[str] = Field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
     url: Optional[str]
     created_at: datetime
     updated_at: datetime
     resolved_at: Optional[datetime]
+    
+    @classmethod
+    def from_trusted(cls, **values):
+        """Build without validation, treating NULL labels as an empty list."""
+        values["labels"] = values.get("labels") or []
+        return super(WorkItemResponse, cls).from_trusted(**values)
 
 
-class TeamMemberResponse(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class TeamMemberResponse(TrustedDataclass):
     """Team member response model."""
     id: str
     external_id: str
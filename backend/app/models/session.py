@@ -1,17 +1,20 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, LargeBinary
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
 from .database import Base
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import uuid
 
 class UserSession(Base):
     """User session model for JWT token management"""
     __tablename__ = "user_sessions"
+    __table_args__ = (
+        Index("ix_user_sessions_token_hash_expires", "token_hash", "expires_at"),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     user_id = Column(String, ForeignKey("users.id"), nullable=False, index=True)
-    token_hash = Column(String, nullable=False, unique=True)
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True)  # raw SHA-256 digest
     expires_at = Column(DateTime(timezone=True), nullable=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     
@@ -24,7 +27,11 @@ class UserSession(Base):
     @property
     def is_expired(self) -> bool:
         """Check if session is expired"""
-        return datetime.utcnow() > self.expires_at
+        expires_at = self.expires_at
+        if expires_at.tzinfo is not None:
+            # PostgreSQL returns timestamptz values as aware datetimes
+            expires_at = expires_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return datetime.utcnow() > expires_at
     
     @classmethod
     def create_expiry_time(cls, minutes: int = 30) -> datetime:
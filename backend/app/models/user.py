@@ -1,14 +1,18 @@
-from sqlalchemy import Column, String, DateTime, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from .database import Base
+from .database import Base, JSONDocument
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, List, Optional
 import uuid
 
 class User(Base):
     """User model for authentication and profile management"""
     __tablename__ = "users"
+    __table_args__ = (
+        # Login lookup by email among active users; partial on PostgreSQL
+        Index("ix_users_email_active", "email", "is_active", postgresql_where=text("is_active")),
+    )
     
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     email = Column(String, unique=True, nullable=False, index=True)
@@ -18,8 +22,8 @@ class User(Base):
     is_active = Column(Boolean, default=True)
     
     # JSON fields for complex data
-    skills_json = Column(Text, default="[]")  # JSON array of skills
-    learning_progress_json = Column(Text, default="{}")  # JSON object of progress
+    skills_json = Column(JSONDocument, default=list)  # JSON array of skills
+    learning_progress_json = Column(JSONDocument, default=dict)  # JSON object of progress
     
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -29,4 +33,22 @@ class User(Base):
     sessions = relationship("UserSession", back_populates="user", cascade="all, delete-orphan")
     
     def __repr__(self):
-        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
\ No newline at end of file
+        return f"<User(id={self.id}, email={self.email}, role={self.role})>"
+    
+    @property
+    def skills(self) -> List[str]:
+        """Skills list, decoded by the column type"""
+        return self.skills_json or []
+    
+    @skills.setter
+    def skills(self, value: List[str]):
+        self.skills_json = value
+    
+    @property
+    def learning_progress(self) -> Dict[str, Any]:
+        """Learning progress mapping, decoded by the column type"""
+        return self.learning_progress_json or {}
+    
+    @learning_progress.setter
+    def learning_progress(self, value: Dict[str, Any]):
+        self.learning_progress_json = value
\ No newline at end of file
@@ -1,7 +1,9 @@
-from .auth import AuthService, get_current_user, get_current_active_user
+from .auth import AuthService, get_current_user, get_current_active_user, get_current_token_claims, get_bearer_token
 
 __all__ = [
     "AuthService",
     "get_current_user", 
-    "get_current_active_user"
+    "get_current_active_user",
+    "get_current_token_claims",
+    "get_bearer_token"
 ]
\ No newline at end of file
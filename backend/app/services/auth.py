@@ -1,33 +1,79 @@
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional, Union
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, status, Depends, Header
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
-from ..models import User, UserSession, get_db
+from sqlalchemy import select, delete, inspect
+from sqlalchemy.orm import make_transient_to_detached
+from ..models import User, UserSession, AsyncSessionLocal, get_db
 from ..config import settings
+from ..utils import json_dumps
+from cachetools import TTLCache
+import asyncio
+import base64
+import bcrypt
+import calendar
+import copy
 import hashlib
+import hmac
+import logging
+import time
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+logger = logging.getLogger(__name__)
 
 # JWT token security
 security = HTTPBearer()
 
+# JWT decode arguments built once at import rather than per request
+_JWT_ALGORITHMS = [settings.algorithm]
+_JWT_DECODE_OPTIONS = {"require_exp": True, "require_sub": True}
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding used for JWT segments"""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+# HMAC-signed tokens are minted directly: the header segment and keyed HMAC are built
+# once and copied per token; other algorithms go through jose
+_JWT_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+_JWT_HEADER_SEGMENT = _b64url(json_dumps({"alg": settings.algorithm, "typ": "JWT"}).encode())
+_jwt_signer = (
+    hmac.new(settings.secret_key.encode(), digestmod=_JWT_HMAC_DIGESTS[settings.algorithm])
+    if settings.algorithm in _JWT_HMAC_DIGESTS else None
+)
+
+# Verified JWT claims keyed by token digest; entries expire well before the tokens do
+_token_claims_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+# Digests of tokens revoked by this process, kept until the tokens would have expired
+_revoked_tokens: TTLCache = TTLCache(maxsize=10_000, ttl=settings.access_token_expire_minutes * 60)
+
+# Users resolved from tokens, kept briefly as plain column values keyed by token digest
+_token_user_cache: TTLCache = TTLCache(maxsize=10_000, ttl=30)
+_USER_COLUMNS = tuple(attr.key for attr in inspect(User).column_attrs)
+
+def _bcrypt_secret(password: str) -> bytes:
+    """Password bytes as bcrypt consumes them (only the first 72 bytes are significant)"""
+    return password.encode("utf-8")[:72]
+
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Hash verified against when no user matches, to keep login timing uniform"""
+    return AuthService.get_password_hash("dummy-password-for-timing")
+
 class AuthService:
     """Authentication service for user management and JWT tokens"""
     
     @staticmethod
     def verify_password(plain_password: str, hashed_password: str) -> bool:
         """Verify a password against its hash"""
-        return pwd_context.verify(plain_password, hashed_password)
+        return bcrypt.checkpw(_bcrypt_secret(plain_password), hashed_password.encode())
     
     @staticmethod
     def get_password_hash(password: str) -> str:
         """Hash a password"""
-        return pwd_context.hash(password)
+        return bcrypt.hashpw(_bcrypt_secret(password), bcrypt.gensalt(rounds=settings.bcrypt_rounds)).decode()
     
     @staticmethod
     def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -39,22 +85,40 @@ class AuthService:
             expire = datetime.utcnow() + timedelta(minutes=settings.access_token_expire_minutes)
         
         to_encode.update({"exp": expire})
-        encoded_jwt = jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
-        return encoded_jwt
+        if _jwt_signer is None:
+            return jwt.encode(to_encode, settings.secret_key, algorithm=settings.algorithm)
+        
+        to_encode["exp"] = calendar.timegm(expire.utctimetuple())
+        signing_input = _JWT_HEADER_SEGMENT + b"." + _b64url(json_dumps(to_encode).encode())
+        signer = _jwt_signer.copy()
+        signer.update(signing_input)
+        return (signing_input + b"." + _b64url(signer.digest())).decode()
     
     @staticmethod
     def decode_access_token(token: str) -> Optional[dict]:
-        """Decode JWT access token"""
-        try:
-            payload = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        """Decode JWT access token, reusing recently verified claims"""
+        digest = AuthService.token_digest(token)
+        payload = _token_claims_cache.get(digest)
+        if payload is not None and payload.get("exp", 0) > time.time():
             return payload
+        
+        try:
+            payload = jwt.decode(token, settings.secret_key, algorithms=_JWT_ALGORITHMS, options=_JWT_DECODE_OPTIONS)
         except JWTError:
             return None
+        
+        _token_claims_cache[digest] = payload
+        return payload
     
     @staticmethod
-    def hash_token(token: str) -> str:
-        """Create hash of token for storage"""
-        return hashlib.sha256(token.encode()).hexdigest()
+    def token_digest(token: str) -> bytes:
+        """Short digest of a token used as an in-process cache key"""
+        return hashlib.blake2b(token.encode(), digest_size=16).digest()
+    
+    @staticmethod
+    def hash_token(token: str) -> bytes:
+        """Create hash of token for storage (raw 32-byte SHA-256 digest)"""
+        return hashlib.sha256(token.encode()).digest()
     
     @staticmethod
     async def authenticate_user(db: AsyncSession, email: str, password: str) -> Optional[User]:
@@ -62,13 +126,21 @@ class AuthService:
         result = await db.execute(select(User).where(User.email == email, User.is_active == True))
         user = result.scalar_one_or_none()
         
-        if not user or not AuthService.verify_password(password, user.hashed_password):
+        # bcrypt runs in a worker thread; unknown emails verify against a dummy hash so
+        # both paths take the same time
+        hashed_password = user.hashed_password if user else await asyncio.to_thread(_dummy_password_hash)
+        is_valid = await asyncio.to_thread(AuthService.verify_password, password, hashed_password)
+        
+        if not user or not is_valid:
             return None
         return user
     
     @staticmethod
-    async def create_user_session(db: AsyncSession, user: User, token: str) -> UserSession:
-        """Create a new user session"""
+    async def create_user_session(db: AsyncSession, user: User, token: str, commit: bool = True) -> UserSession:
+        """Create a new user session
+        
+        Pass commit=False to leave the INSERT pending in the caller's transaction.
+        """
         token_hash = AuthService.hash_token(token)
         expires_at = UserSession.create_expiry_time(settings.access_token_expire_minutes)
         
@@ -79,51 +151,97 @@ class AuthService:
         )
         
         db.add(session)
-        await db.commit()
-        await db.refresh(session)
+        if commit:
+            await db.commit()
+            await db.refresh(session)
         return session
     
+    @staticmethod
+    async def get_cached_user_by_token(db: AsyncSession, token: str) -> Optional[User]:
+        """Get user by JWT token, reusing a recent lookup for the same token
+        
+        Only column values are cached; a hit rebuilds the User and attaches it to ``db``
+        without a query, so callers can still modify and commit it.
+        """
+        digest = AuthService.token_digest(token)
+        values = _token_user_cache.get(digest)
+        if values is not None and AuthService.decode_access_token(token):
+            user = User(**copy.deepcopy(values))
+            make_transient_to_detached(user)
+            db.add(user)
+            return user
+        
+        user = await AuthService.get_user_by_token(db, token)
+        if user is not None:
+            _token_user_cache[digest] = copy.deepcopy({key: getattr(user, key) for key in _USER_COLUMNS})
+        return user
+    
+    @staticmethod
+    def forget_cached_user(token: str) -> None:
+        """Drop the cached user for a token after the user row changes"""
+        _token_user_cache.pop(AuthService.token_digest(token), None)
+    
     @staticmethod
     async def get_user_by_token(db: AsyncSession, token: str) -> Optional[User]:
         """Get user by JWT token"""
-        # Decode token to get user info
+        # Decode token first so invalid tokens never reach the database
         payload = AuthService.decode_access_token(token)
         if not payload:
             return None
         
-        user_id = payload.get("sub")
-        if not user_id:
-            return None
-        
-        # Check if session exists and is valid
+        # Resolve the live session and its active user in one round-trip
         token_hash = AuthService.hash_token(token)
         result = await db.execute(
-            select(UserSession).where(
+            select(User)
+            .join(UserSession, UserSession.user_id == User.id)
+            .where(
                 UserSession.token_hash == token_hash,
-                UserSession.expires_at > datetime.utcnow()
+                UserSession.expires_at > datetime.utcnow(),
+                User.is_active == True
             )
         )
-        session = result.scalar_one_or_none()
-        
-        if not session:
-            return None
-        
-        # Get user
-        result = await db.execute(select(User).where(User.id == user_id, User.is_active == True))
         return result.scalar_one_or_none()
     
     @staticmethod
     async def revoke_session(db: AsyncSession, token: str) -> bool:
         """Revoke a user session"""
+        digest = AuthService.token_digest(token)
+        _token_claims_cache.pop(digest, None)
+        _token_user_cache.pop(digest, None)
+        _revoked_tokens[digest] = True
         token_hash = AuthService.hash_token(token)
-        result = await db.execute(select(UserSession).where(UserSession.token_hash == token_hash))
-        session = result.scalar_one_or_none()
-        
-        if session:
-            await db.delete(session)
-            await db.commit()
-            return True
-        return False
+        result = await db.execute(
+            delete(UserSession)
+            .where(UserSession.token_hash == token_hash)
+            .returning(UserSession.id)
+            .execution_options(synchronize_session=False)
+        )
+        revoked = result.first() is not None
+        await db.commit()
+        return revoked
+    
+    @staticmethod
+    async def delete_expired_sessions(db: AsyncSession, older_than: timedelta = timedelta(hours=1)) -> int:
+        """Delete sessions that expired more than ``older_than`` ago"""
+        result = await db.execute(
+            delete(UserSession)
+            .where(UserSession.expires_at < datetime.utcnow() - older_than)
+            .execution_options(synchronize_session=False)
+        )
+        await db.commit()
+        return result.rowcount
+
+async def sweep_expired_sessions(interval_seconds: int) -> None:
+    """Periodically purge expired sessions so the session indexes stay small"""
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            async with AsyncSessionLocal() as db:
+                deleted = await AuthService.delete_expired_sessions(db)
+            if deleted:
+                logger.info("Deleted %d expired sessions", deleted)
+        except Exception:
+            logger.exception("Expired session sweep failed")
 
 # Dependency for getting current user
 async def get_current_user(
@@ -139,13 +257,39 @@ async def get_current_user(
     
     try:
         token = credentials.credentials
-        user = await AuthService.get_user_by_token(db, token)
+        user = await AuthService.get_cached_user_by_token(db, token)
         if user is None:
             raise credentials_exception
         return user
     except Exception:
         raise credentials_exception
 
+# Dependency for reading the raw bearer token from the Authorization header
+async def get_bearer_token(authorization: Optional[str] = Header(None)) -> str:
+    """Dependency to extract the bearer token without building credential objects"""
+    if not authorization:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authenticated")
+    
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token.strip():
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid authentication credentials")
+    return token.strip()
+
+# Dependency for validating the bearer token without loading the user
+async def get_current_token_claims(
+    credentials: HTTPAuthorizationCredentials = Depends(security)
+) -> dict:
+    """Dependency to get verified JWT claims; skips the session and user lookups"""
+    token = credentials.credentials
+    payload = AuthService.decode_access_token(token)
+    if not payload or not payload.get("sub") or AuthService.token_digest(token) in _revoked_tokens:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return payload
+
 # Dependency for getting current active user
 async def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Dependency to get current active user"""
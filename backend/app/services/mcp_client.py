@@ -2,14 +2,22 @@
 Base MCP client infrastructure and service management.
 """
 import asyncio
-import json
+import hashlib
+import importlib.util
 import logging
+import math
+import random
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional, Any, Type
+from collections import defaultdict
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple, Type
 from contextlib import asynccontextmanager
 
 import httpx
+from cachetools import TTLCache
+from redis.exceptions import RedisError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, update
 
@@ -18,10 +26,47 @@ from ..models.mcp import (
     RepositoryData, ProjectData, SyncResult, MCPHealthCheck
 )
 from ..models.database import AsyncSessionLocal
+from ..utils import json_loads
+from .response_cache import get_cache_client, mark_cache_unavailable
 
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent outbound calls when fanning out across services
+MAX_CONCURRENT_SERVICE_CALLS = 16
+
+# Seconds a service's health check result is shared by repeated or concurrent probes
+HEALTH_CHECK_CACHE_TTL = 1.0
+
+# Seconds the configured service list is reused by health_check_all; CRUD endpoints invalidate it
+SERVICE_LIST_CACHE_TTL = 30.0
+
+# Connection pool shared by every MCP client; keep-alive avoids a TCP/TLS handshake per request
+MCP_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# Multiplex concurrent requests to a host over one HTTP/2 connection when the optional
+# h2 package is installed (httpx[http2]); servers without HTTP/2 fall back via ALPN
+MCP_HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# Immediate retries of failed TCP/TLS connects on the shared pool, before any request is sent
+MCP_CONNECT_RETRIES = 2
+
+# Upper bound in seconds on a single retry backoff delay
+RETRY_BACKOFF_CAP = 30.0
+
+# Upper bound on concurrent page requests while walking one paginated listing
+MAX_CONCURRENT_PAGE_FETCHES = 8
+
+# Seconds cached upstream GET responses stay fresh: listings change faster than single resources
+UPSTREAM_CACHE_TTL_SHORT = 10
+UPSTREAM_CACHE_TTL_NORMAL = 30
+
+# Seconds an expired upstream response is kept to serve when the service is failing
+UPSTREAM_STALE_TTL = 24 * 60 * 60
+
+# Recently validated credentials keyed by a digest of service type, endpoint and credentials
+_validated_credentials: TTLCache = TTLCache(maxsize=1024, ttl=60)
+
 
 class MCPClientError(Exception):
     """Base exception for MCP client errors."""
@@ -46,23 +91,28 @@ class MCPRateLimitError(MCPClientError):
 class BaseMCPClient(ABC):
     """Abstract base class for MCP service clients."""
     
-    def __init__(self, config: MCPConfig):
+    def __init__(self, config: MCPConfig, http_client: Optional[httpx.AsyncClient] = None):
         self.config = config
         self.service_type = config.service_type
         self.endpoint = config.endpoint
         self.credentials = config.credentials
         self.timeout = config.timeout
         self.retry_attempts = config.retry_attempts
+        self._shared_client = http_client
         self._client: Optional[httpx.AsyncClient] = None
-        self._rate_limiter = self._create_rate_limiter()
-    
-    def _create_rate_limiter(self) -> Dict[str, Any]:
-        """Create rate limiter based on service configuration."""
-        return {
-            "requests_per_minute": self.config.rate_limits.get("requests_per_minute", 60),
-            "requests_per_hour": self.config.rate_limits.get("requests_per_hour", 1000),
-            "last_request_times": []
-        }
+        self._auth_headers: Mapping[str, str] = MappingProxyType({})
+        self._request_timeout = httpx.Timeout(self.timeout)
+        self._init_rate_limiter()
+    
+    def _init_rate_limiter(self):
+        """Set up per-minute and per-hour token buckets from the service configuration."""
+        self._requests_per_minute = self.config.rate_limits.get("requests_per_minute", 60)
+        self._requests_per_hour = self.config.rate_limits.get("requests_per_hour", 1000)
+        self._minute_tokens = float(self._requests_per_minute)
+        self._hour_tokens = float(self._requests_per_hour)
+        self._tokens_refilled_at = time.monotonic()
+        # Monotonic deadline from the service's last Retry-After; shared by all callers
+        self._blocked_until = 0.0
     
     async def __aenter__(self):
         """Async context manager entry."""
@@ -76,10 +126,10 @@ class BaseMCPClient(ABC):
     async def connect(self) -> bool:
         """Establish connection to the MCP service."""
         try:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self.timeout),
-                headers=self._get_auth_headers()
-            )
+            # Built once per connection and shared read-only by every request
+            self._auth_headers = MappingProxyType(self._get_auth_headers())
+            # Standalone clients (e.g. in tests) get a private pool
+            self._client = self._shared_client or httpx.AsyncClient(limits=MCP_HTTP_LIMITS)
             
             # Test connection
             await self.health_check()
@@ -93,7 +143,9 @@ class BaseMCPClient(ABC):
     async def disconnect(self):
         """Close connection to the MCP service."""
         if self._client:
-            await self._client.aclose()
+            # The shared pool is owned by MCPClientManager and closed on shutdown
+            if self._client is not self._shared_client:
+                await self._client.aclose()
             self._client = None
             logger.info(f"Disconnected from {self.service_type} MCP service")
     
@@ -102,9 +154,36 @@ class BaseMCPClient(ABC):
         """Get authentication headers for the service."""
         pass
     
-    @abstractmethod
     async def health_check(self) -> MCPHealthCheck:
-        """Perform health check on the service."""
+        """Perform health check on the service using its cheapest authenticated request."""
+        start_ns = time.monotonic_ns()
+        
+        try:
+            await self._ping()
+            response_time_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+            
+            return MCPHealthCheck(
+                service_id=self.config.name,
+                service_type=self.service_type,
+                status=MCPConnectionStatus.CONNECTED,
+                response_time_ms=response_time_ms,
+                checked_at=datetime.utcnow()
+            )
+            
+        except Exception as e:
+            logger.error(f"{self.service_type} health check failed: {e}")
+            
+            return MCPHealthCheck(
+                service_id=self.config.name,
+                service_type=self.service_type,
+                status=MCPConnectionStatus.ERROR,
+                error_message=str(e),
+                checked_at=datetime.utcnow()
+            )
+    
+    @abstractmethod
+    async def _ping(self) -> None:
+        """Make a minimal authenticated request, raising if the service is unreachable."""
         pass
     
     @abstractmethod
@@ -144,16 +223,31 @@ class BaseMCPClient(ABC):
         
         await self._check_rate_limit()
         
+        headers = self._auth_headers
+        if 'headers' in kwargs:
+            headers = {**headers, **kwargs.pop('headers')}
+        
         for attempt in range(self.retry_attempts):
             try:
-                response = await self._client.request(method, url, **kwargs)
+                response = await self._client.request(
+                    method,
+                    url,
+                    headers=headers,
+                    timeout=self._request_timeout,
+                    **kwargs
+                )
                 
                 if response.status_code == 429:  # Rate limited
                     retry_after = int(response.headers.get("Retry-After", 60))
+                    self._blocked_until = max(self._blocked_until, time.monotonic() + retry_after)
                     logger.warning(f"Rate limited, waiting {retry_after} seconds")
-                    await asyncio.sleep(retry_after)
+                    await self._wait_until_unblocked()
                     continue
                 
+                # Only sent in answer to a conditional request; the caller holds the body
+                if response.status_code == httpx.codes.NOT_MODIFIED:
+                    return response
+                
                 response.raise_for_status()
                 return response
                 
@@ -165,49 +259,222 @@ class BaseMCPClient(ABC):
                 elif attempt == self.retry_attempts - 1:
                     raise MCPClientError(f"Request failed: {e}")
                 
-                # Exponential backoff
-                wait_time = 2 ** attempt
-                logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+                wait_time = self._backoff_delay(attempt)
+                logger.warning(f"Request failed, retrying in {wait_time:.1f}s: {e}")
                 await asyncio.sleep(wait_time)
             
             except Exception as e:
                 if attempt == self.retry_attempts - 1:
                     raise MCPClientError(f"Request failed: {e}")
                 
-                wait_time = 2 ** attempt
-                logger.warning(f"Request failed, retrying in {wait_time}s: {e}")
+                wait_time = self._backoff_delay(attempt)
+                logger.warning(f"Request failed, retrying in {wait_time:.1f}s: {e}")
                 await asyncio.sleep(wait_time)
         
         raise MCPClientError("Max retry attempts exceeded")
     
+    async def _get_json(self, url: str, ttl: int, params: Optional[Dict[str, Any]] = None) -> Any:
+        """GET and decode a JSON resource, sharing responses through Redis for ``ttl`` seconds.
+        
+        Expired entries are revalidated with their ETag, so an unchanged resource costs a
+        bodiless 304. Entries are kept past their TTL so the last good body can be served
+        when the service fails; authentication errors are always raised.
+        """
+        data, _ = await self._get_json_page(url, ttl, params)
+        return data
+    
+    async def _get_json_page(
+        self,
+        url: str,
+        ttl: int,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Tuple[Any, Optional[int]]:
+        """Like ``_get_json``, also returning the listing's page count when the service sends one."""
+        cache = get_cache_client()
+        if cache is not None:
+            key = self._upstream_cache_key(url, params)
+            try:
+                entry = await cache.hgetall(key)
+                # A hash without a body is unusable, whatever else it holds
+                if b"body" not in entry:
+                    entry = {}
+            except RedisError as e:
+                logger.warning(f"Upstream cache read failed: {e}")
+                mark_cache_unavailable()
+                cache = None
+        
+        if cache is None:
+            response = await self._make_request('GET', url, params=params)
+            return json_loads(response.content), self._total_pages(response)
+        
+        if entry and float(entry[b"fresh_until"]) > time.time():
+            return json_loads(entry[b"body"]), self._cached_total_pages(entry)
+        
+        request_kwargs: Dict[str, Any] = {'params': params}
+        if entry.get(b"etag"):
+            request_kwargs['headers'] = {'If-None-Match': entry[b"etag"].decode()}
+        
+        try:
+            response = await self._make_request('GET', url, **request_kwargs)
+        except MCPAuthenticationError:
+            raise
+        except MCPClientError as e:
+            if not entry:
+                raise
+            logger.warning(f"Serving stale {self.service_type} response for {url}: {e}")
+            return json_loads(entry[b"body"]), self._cached_total_pages(entry)
+        
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            body = entry[b"body"]
+            etag = entry[b"etag"]
+            total_pages = self._cached_total_pages(entry)
+        else:
+            body = response.content
+            etag = response.headers.get('ETag', '')
+            total_pages = self._total_pages(response)
+        
+        # Every field is rewritten, so a key that expired since the read comes back whole
+        update = {
+            "body": body,
+            "etag": etag,
+            "total_pages": total_pages or '',
+            "fresh_until": time.time() + ttl
+        }
+        
+        try:
+            async with cache.pipeline(transaction=False) as pipe:
+                pipe.hset(key, mapping=update)
+                pipe.expire(key, UPSTREAM_STALE_TTL)
+                await pipe.execute()
+        except RedisError as e:
+            logger.warning(f"Upstream cache write failed: {e}")
+            mark_cache_unavailable()
+        
+        return json_loads(body), total_pages
+    
+    @staticmethod
+    def _total_pages(response: httpx.Response) -> Optional[int]:
+        """Page count from GitLab's ``X-Total-Pages`` or the ``page`` of a ``rel="last"`` link."""
+        total = response.headers.get('X-Total-Pages')
+        if not total:
+            last = response.links.get('last', {}).get('url')
+            total = httpx.URL(last).params.get('page') if last else None
+        return int(total) if total and total.isdigit() else None
+    
+    @staticmethod
+    def _cached_total_pages(entry: Dict[bytes, bytes]) -> Optional[int]:
+        """Page count stored with a cached response; entries written without one yield None."""
+        total = entry.get(b"total_pages")
+        return int(total) if total else None
+    
+    async def _get_pages(
+        self,
+        url: str,
+        ttl: int,
+        params: Dict[str, Any],
+        limit: int,
+        max_per_page: int = 100
+    ) -> List[Any]:
+        """Fetch up to ``limit`` items from a ``page``/``per_page`` listing.
+        
+        The first page is fetched alone. If it is full and more items are wanted, the
+        remaining pages are fetched concurrently up to the page count the service reports
+        (``X-Total-Pages`` or a ``rel="last"`` link); without one they are walked in order
+        until a short page. Items after the first short page are dropped.
+        """
+        per_page = min(limit, max_per_page)
+        
+        def page_params(page: int) -> Dict[str, Any]:
+            return {**params, 'page': page, 'per_page': per_page}
+        
+        first_page, total_pages = await self._get_json_page(url, ttl, params=page_params(1))
+        items = list(first_page)
+        if len(items) < per_page or len(items) >= limit:
+            return items[:limit]
+        
+        last_page = math.ceil(limit / per_page)
+        if total_pages is None:
+            for page in range(2, last_page + 1):
+                page_items = await self._get_json(url, ttl, params=page_params(page))
+                items.extend(page_items)
+                if len(page_items) < per_page:
+                    break
+            return items[:limit]
+        
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_PAGE_FETCHES)
+        
+        async def fetch_page(page: int) -> List[Any]:
+            async with semaphore:
+                return await self._get_json(url, ttl, params=page_params(page))
+        
+        pages = await asyncio.gather(*(
+            fetch_page(page) for page in range(2, min(last_page, total_pages) + 1)
+        ))
+        
+        for page_items in pages:
+            items.extend(page_items)
+            if len(page_items) < per_page:
+                break
+        
+        return items[:limit]
+    
+    def _upstream_cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Cache key for a GET, scoped to the credentials so users never share responses."""
+        digest = hashlib.blake2b(
+            repr((self._auth_headers.get('Authorization'), url, sorted((params or {}).items()))).encode(),
+            digest_size=16
+        ).hexdigest()
+        return f"mcp-cache:{self.service_type}:{digest}"
+    
+    @staticmethod
+    def _backoff_delay(attempt: int) -> float:
+        """Exponential backoff with full jitter, so clients failing together don't retry in lockstep."""
+        return random.uniform(0, min(RETRY_BACKOFF_CAP, 2 ** attempt))
+    
+    def _refill_rate_limit(self):
+        """Add the tokens earned since the last refill, capped at each bucket's size."""
+        now = time.monotonic()
+        elapsed = now - self._tokens_refilled_at
+        self._tokens_refilled_at = now
+        self._minute_tokens = min(
+            self._requests_per_minute,
+            self._minute_tokens + elapsed * self._requests_per_minute / 60
+        )
+        self._hour_tokens = min(
+            self._requests_per_hour,
+            self._hour_tokens + elapsed * self._requests_per_hour / 3600
+        )
+    
+    async def _wait_until_unblocked(self):
+        """Sleep out the service's Retry-After window, so rate-limited callers resume together once."""
+        delay = self._blocked_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
     async def _check_rate_limit(self):
-        """Check and enforce rate limiting."""
-        now = datetime.utcnow()
-        rate_limiter = self._rate_limiter
-        
-        # Clean old request times (older than 1 hour)
-        rate_limiter["last_request_times"] = [
-            req_time for req_time in rate_limiter["last_request_times"]
-            if (now - req_time).total_seconds() < 3600
-        ]
-        
-        # Check hourly limit
-        if len(rate_limiter["last_request_times"]) >= rate_limiter["requests_per_hour"]:
-            raise MCPRateLimitError("Hourly rate limit exceeded")
-        
-        # Check per-minute limit
-        recent_requests = [
-            req_time for req_time in rate_limiter["last_request_times"]
-            if (now - req_time).total_seconds() < 60
-        ]
-        
-        if len(recent_requests) >= rate_limiter["requests_per_minute"]:
-            wait_time = 60 - (now - min(recent_requests)).total_seconds()
+        """Check and enforce rate limiting.
+        
+        Refill, check and deduct run without awaiting, so they are atomic on the event
+        loop; waiters sleep without holding anything and re-check on wake-up.
+        """
+        await self._wait_until_unblocked()
+        
+        while True:
+            self._refill_rate_limit()
+            
+            # Check hourly limit
+            if self._hour_tokens < 1:
+                raise MCPRateLimitError("Hourly rate limit exceeded")
+            
+            # Check per-minute limit; record this request if a token is available
+            if self._minute_tokens >= 1:
+                self._minute_tokens -= 1
+                self._hour_tokens -= 1
+                return
+            
+            wait_time = (1 - self._minute_tokens) * 60 / self._requests_per_minute
             logger.info(f"Rate limit reached, waiting {wait_time:.1f}s")
             await asyncio.sleep(wait_time)
-        
-        # Record this request
-        rate_limiter["last_request_times"].append(now)
 
 
 class MCPClientManager:
@@ -216,6 +483,33 @@ class MCPClientManager:
     def __init__(self):
         self._clients: Dict[str, BaseMCPClient] = {}
         self._client_classes: Dict[MCPServiceType, Type[BaseMCPClient]] = {}
+        self._http_client: Optional[httpx.AsyncClient] = None
+        self._health_cache: Dict[str, Tuple[float, MCPHealthCheck]] = {}
+        self._health_locks: Dict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+        self._connect_inflight: Dict[str, asyncio.Task] = {}
+        self._services_cache: Optional[Tuple[float, List[Tuple[str, str]]]] = None
+    
+    @property
+    def http_client(self) -> httpx.AsyncClient:
+        """Process-wide pooled HTTP client handed to every MCP client."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                transport=httpx.AsyncHTTPTransport(
+                    limits=MCP_HTTP_LIMITS,
+                    http2=MCP_HTTP2_ENABLED,
+                    retries=MCP_CONNECT_RETRIES
+                )
+            )
+        return self._http_client
+    
+    async def aclose(self):
+        """Disconnect all clients and close the shared HTTP client."""
+        for client in list(self._clients.values()):
+            await client.disconnect()
+        self._clients.clear()
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
     
     def register_client_class(self, service_type: MCPServiceType, client_class: Type[BaseMCPClient]):
         """Register a client class for a service type."""
@@ -228,155 +522,274 @@ class MCPClientManager:
             raise MCPClientError(f"No client registered for {config.service_type}")
         
         client_class = self._client_classes[config.service_type]
-        client = client_class(config)
+        client = client_class(config, http_client=self.http_client)
         
         return client
     
+    async def validate_config(self, config: MCPConfig) -> bool:
+        """Validate service credentials with a short-lived client, reusing recent successes."""
+        key = self._credentials_digest(config)
+        if key in _validated_credentials:
+            return True
+        
+        client = await self.create_client(config)
+        
+        try:
+            await client.connect()
+            is_valid = await client.validate_credentials()
+        finally:
+            await client.disconnect()
+        
+        if is_valid:
+            _validated_credentials[key] = True
+        return is_valid
+    
+    @staticmethod
+    def _credentials_digest(config: MCPConfig) -> bytes:
+        """Short digest identifying a set of credentials for a service endpoint."""
+        material = repr((
+            config.service_type,
+            config.endpoint,
+            sorted(config.credentials.items())
+        ))
+        return hashlib.blake2b(material.encode(), digest_size=16).digest()
+    
     async def get_client(self, service_id: str) -> Optional[BaseMCPClient]:
         """Get an existing client by service ID."""
         return self._clients.get(service_id)
     
     async def connect_service(self, service_id: str) -> bool:
-        """Connect to an MCP service by ID."""
+        """Connect to an MCP service by ID.
+        
+        Concurrent calls for the same service share a single in-flight connect.
+        """
+        task = self._connect_inflight.get(service_id)
+        if task is None:
+            task = asyncio.ensure_future(self._connect_service(service_id))
+            self._connect_inflight[service_id] = task
+            task.add_done_callback(
+                lambda done: self._connect_inflight.pop(service_id, None)
+                if self._connect_inflight.get(service_id) is done else None
+            )
+        
+        # Shielded so one caller's cancellation doesn't abort the connect for the others
+        return await asyncio.shield(task)
+    
+    async def _connect_service(self, service_id: str) -> bool:
+        """Load a service's configuration, connect a client and record the outcome."""
+        # Read only the columns the client needs, and release the connection
+        # before the network round trip to the service
         async with AsyncSessionLocal() as session:
-            # Load service configuration from database
             result = await session.execute(
-                select(MCPService).where(MCPService.id == service_id)
+                select(
+                    MCPService.service_type,
+                    MCPService.name,
+                    MCPService.endpoint,
+                    MCPService.credentials_json,
+                    MCPService.enabled,
+                    MCPService.rate_limits_json,
+                    MCPService.timeout,
+                    MCPService.retry_attempts
+                ).where(MCPService.id == service_id)
             )
-            service = result.scalar_one_or_none()
-            
-            if not service:
-                raise MCPClientError(f"Service {service_id} not found")
-            
-            if not service.enabled:
-                raise MCPClientError(f"Service {service_id} is disabled")
-            
-            # Create configuration
-            config = MCPConfig(
-                service_type=MCPServiceType(service.service_type),
-                name=service.name,
-                endpoint=service.endpoint,
-                credentials=json.loads(service.credentials_json),
-                enabled=service.enabled,
-                rate_limits=json.loads(service.rate_limits_json or "{}"),
-                timeout=service.timeout,
-                retry_attempts=service.retry_attempts
+            service = result.one_or_none()
+        
+        if not service:
+            raise MCPClientError(f"Service {service_id} not found")
+        
+        if not service.enabled:
+            raise MCPClientError(f"Service {service_id} is disabled")
+        
+        # Create configuration
+        config = MCPConfig(
+            service_type=MCPServiceType(service.service_type),
+            name=service.name,
+            endpoint=service.endpoint,
+            credentials=service.credentials_json,
+            enabled=service.enabled,
+            rate_limits=service.rate_limits_json or {},
+            timeout=service.timeout,
+            retry_attempts=service.retry_attempts
+        )
+        
+        # Create and connect client
+        client = await self.create_client(config)
+        
+        try:
+            await client.connect()
+        except Exception as e:
+            # Update service status with error
+            await self._set_service_status(
+                service_id,
+                status=MCPConnectionStatus.ERROR.value,
+                last_error=str(e)
             )
-            
-            # Create and connect client
-            client = await self.create_client(config)
-            
-            try:
-                await client.connect()
-                self._clients[service_id] = client
-                
-                # Update service status
-                await session.execute(
-                    update(MCPService)
-                    .where(MCPService.id == service_id)
-                    .values(
-                        status=MCPConnectionStatus.CONNECTED.value,
-                        last_connected=datetime.utcnow(),
-                        last_error=None
-                    )
-                )
-                await session.commit()
-                
-                return True
-                
-            except Exception as e:
-                # Update service status with error
-                await session.execute(
-                    update(MCPService)
-                    .where(MCPService.id == service_id)
-                    .values(
-                        status=MCPConnectionStatus.ERROR.value,
-                        last_error=str(e)
-                    )
-                )
-                await session.commit()
-                raise
+            raise
+        
+        # Reconnecting replaces the registered client; close the old one rather than orphan it
+        previous = self._clients.pop(service_id, None)
+        self._clients[service_id] = client
+        self._health_cache.pop(service_id, None)
+        if previous is not None:
+            await previous.disconnect()
+        
+        await self._set_service_status(
+            service_id,
+            status=MCPConnectionStatus.CONNECTED.value,
+            last_connected=datetime.utcnow(),
+            last_error=None
+        )
+        
+        return True
+    
+    @staticmethod
+    async def _set_service_status(service_id: str, **values):
+        """Write connection status fields for a service in a single UPDATE."""
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(MCPService)
+                .where(MCPService.id == service_id)
+                .values(**values)
+            )
+            await session.commit()
     
     async def disconnect_service(self, service_id: str):
         """Disconnect from an MCP service."""
-        client = self._clients.get(service_id)
+        # Unregister first so a failing disconnect can't leave a dead client behind
+        client = self._clients.pop(service_id, None)
+        self.forget_service_health(service_id)
         if client:
             await client.disconnect()
-            del self._clients[service_id]
             
-            async with AsyncSessionLocal() as session:
-                await session.execute(
-                    update(MCPService)
-                    .where(MCPService.id == service_id)
-                    .values(status=MCPConnectionStatus.DISCONNECTED.value)
-                )
-                await session.commit()
+            await self._set_service_status(
+                service_id,
+                status=MCPConnectionStatus.DISCONNECTED.value
+            )
     
     async def sync_all_services(self) -> List[SyncResult]:
         """Synchronize data from all connected services."""
-        results = []
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SERVICE_CALLS)
         
-        for service_id, client in self._clients.items():
+        return list(await asyncio.gather(*(
+            self._sync_service(service_id, client, semaphore)
+            for service_id, client in list(self._clients.items())
+        )))
+    
+    async def _sync_service(
+        self,
+        service_id: str,
+        client: BaseMCPClient,
+        semaphore: asyncio.Semaphore
+    ) -> SyncResult:
+        """Synchronize a single connected service."""
+        async with semaphore:
             try:
                 # This would be implemented by specific sync logic
                 # For now, return a placeholder result
-                result = SyncResult(
+                return SyncResult(
                     service_id=service_id,
                     service_type=client.service_type,
                     status="success",
                     synced_at=datetime.utcnow()
                 )
-                results.append(result)
                 
             except Exception as e:
                 logger.error(f"Sync failed for service {service_id}: {e}")
-                result = SyncResult(
+                return SyncResult(
                     service_id=service_id,
                     service_type=client.service_type,
                     status="failed",
                     synced_at=datetime.utcnow(),
                     errors=[str(e)]
                 )
-                results.append(result)
+    
+    async def health_check_all(self, use_cache: bool = True) -> List[MCPHealthCheck]:
+        """Perform health check on all services.
+        
+        Connected services are probed at most once per HEALTH_CHECK_CACHE_TTL unless
+        use_cache is False.
+        """
+        services = await self._list_services(use_cache)
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SERVICE_CALLS)
         
-        return results
+        return list(await asyncio.gather(*(
+            self._health_check_service(service_id, service_type, semaphore, use_cache)
+            for service_id, service_type in services
+        )))
     
-    async def health_check_all(self) -> List[MCPHealthCheck]:
-        """Perform health check on all services."""
-        results = []
+    async def _list_services(self, use_cache: bool = True) -> List[Tuple[str, str]]:
+        """(id, service_type) of every configured service, reused for SERVICE_LIST_CACHE_TTL."""
+        cached = self._services_cache
+        if use_cache and cached and time.monotonic() - cached[0] < SERVICE_LIST_CACHE_TTL:
+            return cached[1]
         
+        # Read the service list and release the connection before any external calls
         async with AsyncSessionLocal() as session:
-            # Get all services
-            result = await session.execute(select(MCPService))
-            services = result.scalars().all()
+            result = await session.execute(
+                select(MCPService.id, MCPService.service_type)
+            )
+            services = [tuple(row) for row in result]
+        
+        self._services_cache = (time.monotonic(), services)
+        return services
+    
+    def invalidate_services_cache(self):
+        """Drop the cached service list after a service is created, updated or deleted."""
+        self._services_cache = None
+    
+    def forget_service_health(self, service_id: str):
+        """Drop the cached health result and probe lock kept for a service."""
+        self._health_cache.pop(service_id, None)
+        self._health_locks.pop(service_id, None)
+    
+    async def _health_check_service(
+        self,
+        service_id: str,
+        service_type: str,
+        semaphore: asyncio.Semaphore,
+        use_cache: bool = True
+    ) -> MCPHealthCheck:
+        """Perform health check on a single service."""
+        async with semaphore:
+            try:
+                client = self._clients.get(service_id)
+                if client:
+                    if use_cache:
+                        return await self._cached_health_check(service_id, client)
+                    return await client.health_check()
+                
+                return MCPHealthCheck(
+                    service_id=service_id,
+                    service_type=MCPServiceType(service_type),
+                    status=MCPConnectionStatus.DISCONNECTED,
+                    checked_at=datetime.utcnow()
+                )
+                
+            except Exception as e:
+                logger.error(f"Health check failed for service {service_id}: {e}")
+                return MCPHealthCheck(
+                    service_id=service_id,
+                    service_type=MCPServiceType(service_type),
+                    status=MCPConnectionStatus.ERROR,
+                    error_message=str(e),
+                    checked_at=datetime.utcnow()
+                )
+    
+    async def _cached_health_check(self, service_id: str, client: BaseMCPClient) -> MCPHealthCheck:
+        """Health check a client, sharing a recent result; concurrent callers wait for one probe."""
+        cached = self._health_cache.get(service_id)
+        if cached and time.monotonic() - cached[0] < HEALTH_CHECK_CACHE_TTL:
+            return cached[1]
+        
+        async with self._health_locks[service_id]:
+            # Another caller may have refreshed the entry while this one waited
+            cached = self._health_cache.get(service_id)
+            if cached and time.monotonic() - cached[0] < HEALTH_CHECK_CACHE_TTL:
+                return cached[1]
             
-            for service in services:
-                try:
-                    client = self._clients.get(service.id)
-                    if client:
-                        health_check = await client.health_check()
-                    else:
-                        health_check = MCPHealthCheck(
-                            service_id=service.id,
-                            service_type=MCPServiceType(service.service_type),
-                            status=MCPConnectionStatus.DISCONNECTED,
-                            checked_at=datetime.utcnow()
-                        )
-                    
-                    results.append(health_check)
-                    
-                except Exception as e:
-                    logger.error(f"Health check failed for service {service.id}: {e}")
-                    health_check = MCPHealthCheck(
-                        service_id=service.id,
-                        service_type=MCPServiceType(service.service_type),
-                        status=MCPConnectionStatus.ERROR,
-                        error_message=str(e),
-                        checked_at=datetime.utcnow()
-                    )
-                    results.append(health_check)
-        
-        return results
+            health_check = await client.health_check()
+            self._health_cache[service_id] = (time.monotonic(), health_check)
+            return health_check
 
 
 # Global MCP client manager instance
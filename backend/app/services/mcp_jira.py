@@ -11,8 +11,7 @@ import httpx
 
 from .mcp_client import BaseMCPClient, MCPClientError, MCPAuthenticationError
 from ..models.mcp import (
-    MCPConfig, MCPHealthCheck, MCPConnectionStatus,
-    RepositoryData, ProjectData
+    MCPConfig, RepositoryData, ProjectData
 )
 
 
@@ -22,8 +21,8 @@ logger = logging.getLogger(__name__)
 class JiraMCPClient(BaseMCPClient):
     """Jira MCP client implementation."""
     
-    def __init__(self, config: MCPConfig):
-        super().__init__(config)
+    def __init__(self, config: MCPConfig, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(config, http_client)
         self.api_base = config.endpoint.rstrip('/') + '/rest/api/3' if not config.endpoint.endswith('/rest/api/3') else config.endpoint
         self.username = config.credentials.get('username')
         self.api_token = config.credentials.get('api_token')
@@ -44,35 +43,9 @@ class JiraMCPClient(BaseMCPClient):
             'Content-Type': 'application/json'
         }
     
-    async def health_check(self) -> MCPHealthCheck:
-        """Perform health check on Jira API."""
-        start_time = datetime.utcnow()
-        
-        try:
-            response = await self._make_request('GET', f'{self.api_base}/myself')
-            end_time = datetime.utcnow()
-            
-            response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-            
-            return MCPHealthCheck(
-                service_id=self.config.name,
-                service_type=self.service_type,
-                status=MCPConnectionStatus.CONNECTED,
-                response_time_ms=response_time_ms,
-                checked_at=end_time
-            )
-            
-        except Exception as e:
-            end_time = datetime.utcnow()
-            logger.error(f"Jira health check failed: {e}")
-            
-            return MCPHealthCheck(
-                service_id=self.config.name,
-                service_type=self.service_type,
-                status=MCPConnectionStatus.ERROR,
-                error_message=str(e),
-                checked_at=end_time
-            )
+    async def _ping(self) -> None:
+        """HEAD the current user: checks reachability and credentials without a body."""
+        await self._make_request('HEAD', f'{self.api_base}/myself')
     
     async def validate_credentials(self) -> bool:
         """Validate Jira credentials."""
@@ -275,8 +248,8 @@ class JiraMCPClient(BaseMCPClient):
                     resolved_at = None
                     if fields.get('resolutiondate'):
                         try:
-                            resolved_at = datetime.fromisoformat(fields['resolutiondate'].replace('Z', '+00:00'))
-                        except:
+                            resolved_at = datetime.fromisoformat(fields['resolutiondate'])
+                        except ValueError:
                             pass
                     
                     work_item = {
@@ -311,8 +284,8 @@ class JiraMCPClient(BaseMCPClient):
 class AzureDevOpsMCPClient(BaseMCPClient):
     """Azure DevOps MCP client implementation."""
     
-    def __init__(self, config: MCPConfig):
-        super().__init__(config)
+    def __init__(self, config: MCPConfig, http_client: Optional[httpx.AsyncClient] = None):
+        super().__init__(config, http_client)
         # Azure DevOps API endpoint format: https://dev.azure.com/{organization}
         self.organization = config.credentials.get('organization')
         self.personal_access_token = config.credentials.get('personal_access_token')
@@ -335,39 +308,13 @@ class AzureDevOpsMCPClient(BaseMCPClient):
             'Content-Type': 'application/json'
         }
     
-    async def health_check(self) -> MCPHealthCheck:
-        """Perform health check on Azure DevOps API."""
-        start_time = datetime.utcnow()
-        
-        try:
-            response = await self._make_request(
-                'GET', 
-                f'{self.api_base}/projects',
-                params={'api-version': '7.0'}
-            )
-            end_time = datetime.utcnow()
-            
-            response_time_ms = int((end_time - start_time).total_seconds() * 1000)
-            
-            return MCPHealthCheck(
-                service_id=self.config.name,
-                service_type=self.service_type,
-                status=MCPConnectionStatus.CONNECTED,
-                response_time_ms=response_time_ms,
-                checked_at=end_time
-            )
-            
-        except Exception as e:
-            end_time = datetime.utcnow()
-            logger.error(f"Azure DevOps health check failed: {e}")
-            
-            return MCPHealthCheck(
-                service_id=self.config.name,
-                service_type=self.service_type,
-                status=MCPConnectionStatus.ERROR,
-                error_message=str(e),
-                checked_at=end_time
-            )
+    async def _ping(self) -> None:
+        """List at most one project: the smallest authenticated organization-level request."""
+        await self._make_request(
+            'GET',
+            f'{self.api_base}/projects',
+            params={'api-version': '7.0', '$top': 1}
+        )
     
     async def validate_credentials(self) -> bool:
         """Validate Azure DevOps credentials."""
@@ -481,7 +428,7 @@ class AzureDevOpsMCPClient(BaseMCPClient):
                 project_type="azure_devops",
                 status=project_data.get('state', 'wellFormed'),
                 created_at=datetime.utcnow(),  # Not provided in basic project info
-                updated_at=datetime.fromisoformat(project_data['lastUpdateTime'].replace('Z', '+00:00')),
+                updated_at=datetime.fromisoformat(project_data['lastUpdateTime']),
                 members=members,
                 workflows=[]  # Would need additional API calls for work item types/states
             )
@@ -580,7 +527,7 @@ class AzureDevOpsMCPClient(BaseMCPClient):
                     project_type="azure_devops",
                     status=project_data.get('state', 'wellFormed'),
                     created_at=datetime.utcnow(),
-                    updated_at=datetime.fromisoformat(project_data['lastUpdateTime'].replace('Z', '+00:00')),
+                    updated_at=datetime.fromisoformat(project_data['lastUpdateTime']),
                     members=[],
                     workflows=[]
                 )
@@ -639,13 +586,13 @@ class AzureDevOpsMCPClient(BaseMCPClient):
                     resolved_at = None
                     if fields.get('Microsoft.VSTS.Common.ResolvedDate'):
                         try:
-                            resolved_at = datetime.fromisoformat(fields['Microsoft.VSTS.Common.ResolvedDate'].replace('Z', '+00:00'))
-                        except:
+                            resolved_at = datetime.fromisoformat(fields['Microsoft.VSTS.Common.ResolvedDate'])
+                        except ValueError:
                             pass
                     elif fields.get('Microsoft.VSTS.Common.ClosedDate'):
                         try:
-                            resolved_at = datetime.fromisoformat(fields['Microsoft.VSTS.Common.ClosedDate'].replace('Z', '+00:00'))
-                        except:
+                            resolved_at = datetime.fromisoformat(fields['Microsoft.VSTS.Common.ClosedDate'])
+                        except ValueError:
                             pass
                     
                     # Get story points (effort)
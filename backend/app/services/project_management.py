@@ -1,7 +1,6 @@
 """
 Project Management service for data synchronization and analysis.
 """
-import json
 import logging
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any
@@ -9,7 +8,8 @@ from uuid import uuid4
 from collections import defaultdict, Counter
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update, delete
+from sqlalchemy import select, update, delete, func, case
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.orm import selectinload
 
 from ..models.project_management import (
@@ -23,6 +23,22 @@ from .mcp_client import mcp_manager, MCPClientError
 
 logger = logging.getLogger(__name__)
 
+# Work item statuses (lowercased) counted as in progress / backlog in analytics
+IN_PROGRESS_STATUSES = frozenset({"in progress", "in review", "testing"})
+BACKLOG_STATUSES = frozenset({"to do", "backlog", "new"})
+
+# Rows per INSERT ... ON CONFLICT statement when syncing work items
+WORK_ITEM_UPSERT_BATCH_SIZE = 1000
+
+# Number of most recently updated work items included in a project overview
+RECENT_WORK_ITEMS_LIMIT = 10
+
+# Relationships read when building project overviews; work items are queried separately
+_OVERVIEW_LOAD_OPTIONS = (
+    selectinload(ProjectManagementProject.team_members),
+    selectinload(ProjectManagementProject.workflows)
+)
+
 
 class ProjectManagementService:
     """Service for project management data synchronization and analysis."""
@@ -91,8 +107,9 @@ class ProjectManagementService:
             
         except Exception as e:
             logger.error(f"Failed to sync project data: {e}")
+            # No local project may exist yet, so failures name the project as the service does
             return ProjectSyncStatus(
-                project_id="",
+                project_id=project_identifier,
                 service_id=service_id,
                 last_synced=datetime.utcnow(),
                 sync_status="error",
@@ -124,8 +141,7 @@ class ProjectManagementService:
                     key=project_data.key,
                     description=project_data.description,
                     url=project_data.url,
-                    status=project_data.status,
-                    updated_at=datetime.utcnow()
+                    status=project_data.status
                 )
             )
         else:
@@ -149,70 +165,60 @@ class ProjectManagementService:
         return project
     
     async def _sync_work_items(self, project_id: str, work_items_data: List[Dict]) -> int:
-        """Sync work items for a project."""
-        synced_count = 0
+        """Sync work items for a project with batched INSERT ... ON CONFLICT DO UPDATE."""
+        # Keyed by external ID so a repeated item in the payload upserts once (last wins)
+        rows: Dict[str, Dict[str, Any]] = {}
         
         for item_data in work_items_data:
             try:
-                # Check if work item exists
-                result = await self.db.execute(
-                    select(WorkItem)
-                    .where(
-                        WorkItem.project_id == project_id,
-                        WorkItem.external_id == item_data.get('id', '')
-                    )
-                )
-                work_item = result.scalar_one_or_none()
-                
-                labels_json = json.dumps(item_data.get('labels', []))
-                
-                if work_item:
-                    # Update existing work item
-                    await self.db.execute(
-                        update(WorkItem)
-                        .where(WorkItem.id == work_item.id)
-                        .values(
-                            title=item_data.get('title', ''),
-                            description=item_data.get('description'),
-                            item_type=item_data.get('type', 'task'),
-                            status=item_data.get('status', ''),
-                            priority=item_data.get('priority'),
-                            assignee=item_data.get('assignee'),
-                            reporter=item_data.get('reporter'),
-                            story_points=item_data.get('story_points'),
-                            labels_json=labels_json,
-                            url=item_data.get('url'),
-                            updated_at=datetime.utcnow(),
-                            resolved_at=item_data.get('resolved_at')
-                        )
-                    )
-                else:
-                    # Create new work item
-                    work_item = WorkItem(
-                        id=str(uuid4()),
-                        external_id=item_data.get('id', ''),
-                        project_id=project_id,
-                        title=item_data.get('title', ''),
-                        description=item_data.get('description'),
-                        item_type=item_data.get('type', 'task'),
-                        status=item_data.get('status', ''),
-                        priority=item_data.get('priority'),
-                        assignee=item_data.get('assignee'),
-                        reporter=item_data.get('reporter'),
-                        story_points=item_data.get('story_points'),
-                        labels_json=labels_json,
-                        url=item_data.get('url'),
-                        resolved_at=item_data.get('resolved_at')
-                    )
-                    self.db.add(work_item)
-                
-                synced_count += 1
-                
+                external_id = item_data.get('id', '')
+                rows[external_id] = {
+                    "id": str(uuid4()),
+                    "external_id": external_id,
+                    "project_id": project_id,
+                    "title": item_data.get('title', ''),
+                    "description": item_data.get('description'),
+                    "item_type": item_data.get('type', 'task'),
+                    "status": item_data.get('status', ''),
+                    "priority": item_data.get('priority'),
+                    "assignee": item_data.get('assignee'),
+                    "reporter": item_data.get('reporter'),
+                    "story_points": item_data.get('story_points'),
+                    # Labels are normalized to a list of strings here so readers never need to validate them
+                    "labels_json": [str(label) for label in item_data.get('labels') or []],
+                    "url": item_data.get('url'),
+                    "resolved_at": item_data.get('resolved_at')
+                }
             except Exception as e:
                 logger.warning(f"Failed to sync work item {item_data.get('id', 'unknown')}: {e}")
         
+        if not rows:
+            return 0
+        
+        dialect_insert = (
+            postgresql.insert if self.db.get_bind().dialect.name == "postgresql" else sqlite.insert
+        )
+        values = list(rows.values())
+        # Same clock as the Python-side created_at default, so updated_at never sorts before it
+        now = datetime.utcnow()
+        
+        for start in range(0, len(values), WORK_ITEM_UPSERT_BATCH_SIZE):
+            stmt = dialect_insert(WorkItem).values(values[start:start + WORK_ITEM_UPSERT_BATCH_SIZE])
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[WorkItem.project_id, WorkItem.external_id],
+                set_={
+                    **{
+                        name: stmt.excluded[name]
+                        for name in values[0]
+                        if name not in ("id", "external_id", "project_id")
+                    },
+                    "updated_at": now
+                }
+            )
+            await self.db.execute(stmt)
+        
         await self.db.commit()
-        return synced_count
+        return len(values)
     
     async def _sync_team_members(self, project_id: str, members_data: List[Dict]) -> int:
         """Sync team members for a project."""
@@ -294,9 +300,16 @@ class ProjectManagementService:
             
             # Calculate metrics
             total_work_items = len(work_items)
-            completed_items = [item for item in work_items if item.resolved_at is not None]
-            in_progress_items = [item for item in work_items if item.status.lower() in ['in progress', 'in review', 'testing']]
-            backlog_items = [item for item in work_items if item.status.lower() in ['to do', 'backlog', 'new']]
+            completed_items = []
+            in_progress_count = backlog_count = 0
+            for item in work_items:
+                if item.resolved_at is not None:
+                    completed_items.append(item)
+                status = item.status.lower()
+                if status in IN_PROGRESS_STATUSES:
+                    in_progress_count += 1
+                elif status in BACKLOG_STATUSES:
+                    backlog_count += 1
             
             # Calculate average completion time
             avg_completion_time = None
@@ -337,13 +350,13 @@ class ProjectManagementService:
                 project_id=project_id,
                 total_work_items=total_work_items,
                 completed_work_items=len(completed_items),
-                in_progress_work_items=len(in_progress_items),
-                backlog_work_items=len(backlog_items),
+                in_progress_work_items=in_progress_count,
+                backlog_work_items=backlog_count,
                 active_team_members=len(team_members),
                 avg_completion_time_days=avg_completion_time,
                 velocity_story_points=velocity,
-                communication_patterns_json=json.dumps(communication_patterns),
-                workflow_patterns_json=json.dumps(workflow_patterns)
+                communication_patterns_json=communication_patterns,
+                workflow_patterns_json=workflow_patterns
             )
             
             self.db.add(analytics)
@@ -420,14 +433,9 @@ class ProjectManagementService:
     async def get_project_overview(self, project_id: str) -> Optional[ProjectOverviewResponse]:
         """Get comprehensive project overview."""
         try:
-            # Get project with relationships
             result = await self.db.execute(
                 select(ProjectManagementProject)
-                .options(
-                    selectinload(ProjectManagementProject.work_items),
-                    selectinload(ProjectManagementProject.team_members),
-                    selectinload(ProjectManagementProject.workflows)
-                )
+                .options(*_OVERVIEW_LOAD_OPTIONS)
                 .where(ProjectManagementProject.id == project_id)
             )
             project = result.scalar_one_or_none()
@@ -435,22 +443,88 @@ class ProjectManagementService:
             if not project:
                 return None
             
-            # Get analytics
+            overviews = await self._build_project_overviews([project])
+            return overviews[0]
+            
+        except Exception as e:
+            logger.error(f"Failed to get project overview for {project_id}: {e}")
+            return None
+    
+    async def _build_project_overviews(
+        self, projects: List[ProjectManagementProject]
+    ) -> List[ProjectOverviewResponse]:
+        """Build overviews for projects loaded with _OVERVIEW_LOAD_OPTIONS.
+        
+        Analytics, work item totals and recent work items are fetched for all
+        projects at once, so the query count does not grow with the project count.
+        """
+        if not projects:
+            return []
+        
+        project_ids = [project.id for project in projects]
+        
+        # Get analytics (one row per project is kept by _generate_project_analytics)
+        result = await self.db.execute(
+            select(ProjectAnalytics)
+            .where(ProjectAnalytics.project_id.in_(project_ids))
+            .order_by(ProjectAnalytics.analysis_date)
+        )
+        analytics_by_project = {analytics.project_id: analytics for analytics in result.scalars()}
+        
+        # Work item totals for projects that have not been analyzed yet
+        work_item_counts: Dict[str, int] = {}
+        unanalyzed_ids = [pid for pid in project_ids if pid not in analytics_by_project]
+        if unanalyzed_ids:
             result = await self.db.execute(
-                select(ProjectAnalytics)
-                .where(ProjectAnalytics.project_id == project_id)
-                .order_by(ProjectAnalytics.analysis_date.desc())
+                select(WorkItem.project_id, func.count())
+                .where(WorkItem.project_id.in_(unanalyzed_ids))
+                .group_by(WorkItem.project_id)
             )
-            analytics = result.scalar_one_or_none()
-            
-            # Get recent work items (last 10)
-            recent_work_items = sorted(
-                project.work_items, 
-                key=lambda x: x.updated_at, 
-                reverse=True
-            )[:10]
-            
-            return ProjectOverviewResponse(
+            work_item_counts = dict(result.all())
+        
+        # Get recent work items (last 10 per project)
+        recency = func.row_number().over(
+            partition_by=WorkItem.project_id,
+            order_by=WorkItem.updated_at.desc()
+        ).label("recency")
+        recent = (
+            select(
+                WorkItem.project_id,
+                WorkItem.id,
+                WorkItem.external_id,
+                WorkItem.title,
+                WorkItem.item_type,
+                WorkItem.status,
+                WorkItem.assignee,
+                WorkItem.updated_at,
+                WorkItem.url,
+                recency
+            )
+            .where(WorkItem.project_id.in_(project_ids))
+            .subquery()
+        )
+        result = await self.db.execute(
+            select(recent)
+            .where(recent.c.recency <= RECENT_WORK_ITEMS_LIMIT)
+            .order_by(recent.c.project_id, recent.c.recency)
+        )
+        recent_work_items: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for item in result:
+            recent_work_items[item.project_id].append({
+                "id": item.id,
+                "external_id": item.external_id,
+                "title": item.title,
+                "item_type": item.item_type,
+                "status": item.status,
+                "assignee": item.assignee,
+                "updated_at": item.updated_at,
+                "url": item.url
+            })
+        
+        overviews = []
+        for project in projects:
+            analytics = analytics_by_project.get(project.id)
+            overviews.append(ProjectOverviewResponse.from_trusted(
                 id=project.id,
                 name=project.name,
                 key=project.key,
@@ -459,7 +533,7 @@ class ProjectManagementService:
                 status=project.status,
                 url=project.url,
                 last_synced=project.last_synced,
-                total_work_items=analytics.total_work_items if analytics else len(project.work_items),
+                total_work_items=analytics.total_work_items if analytics else work_item_counts.get(project.id, 0),
                 completed_work_items=analytics.completed_work_items if analytics else 0,
                 in_progress_work_items=analytics.in_progress_work_items if analytics else 0,
                 backlog_work_items=analytics.backlog_work_items if analytics else 0,
@@ -486,24 +560,10 @@ class ProjectManagementService:
                     }
                     for workflow in sorted(project.workflows, key=lambda x: x.order_index or 0)
                 ],
-                recent_work_items=[
-                    {
-                        "id": item.id,
-                        "external_id": item.external_id,
-                        "title": item.title,
-                        "item_type": item.item_type,
-                        "status": item.status,
-                        "assignee": item.assignee,
-                        "updated_at": item.updated_at,
-                        "url": item.url
-                    }
-                    for item in recent_work_items
-                ]
-            )
-            
-        except Exception as e:
-            logger.error(f"Failed to get project overview for {project_id}: {e}")
-            return None
+                recent_work_items=recent_work_items.get(project.id, [])
+            ))
+        
+        return overviews
     
     async def get_project_analytics(self, project_id: str) -> Optional[ProjectAnalyticsResponse]:
         """Get project analytics."""
@@ -522,15 +582,6 @@ class ProjectManagementService:
             if analytics.total_work_items > 0:
                 completion_rate = analytics.completed_work_items / analytics.total_work_items
             
-            communication_patterns = {}
-            workflow_patterns = {}
-            
-            if analytics.communication_patterns_json:
-                communication_patterns = json.loads(analytics.communication_patterns_json)
-            
-            if analytics.workflow_patterns_json:
-                workflow_patterns = json.loads(analytics.workflow_patterns_json)
-            
             return ProjectAnalyticsResponse(
                 project_id=analytics.project_id,
                 analysis_date=analytics.analysis_date,
@@ -542,35 +593,82 @@ class ProjectManagementService:
                 active_team_members=analytics.active_team_members,
                 avg_completion_time_days=analytics.avg_completion_time_days,
                 velocity_story_points=analytics.velocity_story_points,
-                communication_patterns=communication_patterns,
-                workflow_patterns=workflow_patterns
+                communication_patterns=analytics.communication_patterns_json or {},
+                workflow_patterns=analytics.workflow_patterns_json or {}
             )
             
         except Exception as e:
             logger.error(f"Failed to get project analytics for {project_id}: {e}")
             return None
     
+    async def get_dashboard_metrics(self) -> Dict[str, int]:
+        """Aggregate dashboard totals across all projects in a single query."""
+        project = ProjectManagementProject
+        analytics = ProjectAnalytics
+        
+        # Fallbacks used by get_project_overview for projects without analytics
+        work_item_count = (
+            select(func.count(WorkItem.id))
+            .where(WorkItem.project_id == project.id)
+            .correlate(project)
+            .scalar_subquery()
+        )
+        team_member_count = (
+            select(func.count(TeamMember.id))
+            .where(TeamMember.project_id == project.id)
+            .correlate(project)
+            .scalar_subquery()
+        )
+        
+        result = await self.db.execute(
+            select(
+                func.count(project.id),
+                func.sum(case((func.lower(project.status).in_(["active", "wellformed"]), 1), else_=0)),
+                func.sum(func.coalesce(analytics.total_work_items, work_item_count)),
+                func.sum(func.coalesce(analytics.completed_work_items, 0)),
+                func.sum(func.coalesce(analytics.in_progress_work_items, 0)),
+                func.sum(func.coalesce(analytics.active_team_members, team_member_count))
+            )
+            .select_from(project)
+            .outerjoin(analytics, analytics.project_id == project.id)
+        )
+        row = result.one()
+        
+        return {
+            "total_projects": row[0] or 0,
+            "active_projects": row[1] or 0,
+            "total_work_items": row[2] or 0,
+            "completed_work_items": row[3] or 0,
+            "in_progress_work_items": row[4] or 0,
+            "active_team_members": row[5] or 0
+        }
+    
+    async def list_recent_projects(self, limit: int = 5) -> List[ProjectOverviewResponse]:
+        """List the most recently synced projects."""
+        result = await self.db.execute(
+            select(ProjectManagementProject)
+            .options(*_OVERVIEW_LOAD_OPTIONS)
+            .order_by(
+                func.coalesce(
+                    ProjectManagementProject.last_synced,
+                    ProjectManagementProject.updated_at
+                ).desc()
+            )
+            .limit(limit)
+        )
+        
+        return await self._build_project_overviews(list(result.scalars().all()))
+    
     async def list_projects(self, service_id: Optional[str] = None) -> List[ProjectOverviewResponse]:
         """List all projects, optionally filtered by service."""
         try:
-            query = select(ProjectManagementProject).options(
-                selectinload(ProjectManagementProject.team_members),
-                selectinload(ProjectManagementProject.workflows)
-            )
+            query = select(ProjectManagementProject).options(*_OVERVIEW_LOAD_OPTIONS)
             
             if service_id:
                 query = query.where(ProjectManagementProject.service_id == service_id)
             
             result = await self.db.execute(query)
-            projects = result.scalars().all()
-            
-            project_overviews = []
-            for project in projects:
-                overview = await self.get_project_overview(project.id)
-                if overview:
-                    project_overviews.append(overview)
-            
-            return project_overviews
+            return await self._build_project_overviews(list(result.scalars().all()))
             
         except Exception as e:
             logger.error(f"Failed to list projects: {e}")
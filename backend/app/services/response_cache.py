@@ -0,0 +1,126 @@
+"""
+Redis-backed response caching for read-only aggregate endpoints.
+"""
+import hashlib
+import logging
+import time
+from functools import wraps
+from typing import Any, Callable, Optional
+
+import redis.asyncio as redis
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+
+from ..config import settings
+from ..utils import json_dumps
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds caching is bypassed after a Redis error, so an outage doesn't cost every request a timeout
+REDIS_RETRY_INTERVAL = 30.0
+
+# Shared client, created in the application lifespan; caching is bypassed while unset
+_redis_client: Optional[redis.Redis] = None
+
+# Monotonic time until which caching is bypassed after a Redis error
+_redis_down_until = 0.0
+
+
+async def init_response_cache():
+    """Create the shared Redis client for response caching, leaving caching off if Redis is unreachable."""
+    global _redis_client
+    client = redis.from_url(
+        settings.redis_url,
+        socket_connect_timeout=0.5,
+        socket_timeout=0.5
+    )
+    try:
+        await client.ping()
+    except RedisError as e:
+        logger.warning("Response cache disabled, Redis is unreachable: %s", e)
+        await client.aclose()
+        return
+    _redis_client = client
+
+
+def get_cache_client() -> Optional[redis.Redis]:
+    """Shared Redis client, or None while caching is disabled or backing off after an error."""
+    if time.monotonic() < _redis_down_until:
+        return None
+    return _redis_client
+
+
+def mark_cache_unavailable():
+    """Bypass the cache for ``REDIS_RETRY_INTERVAL`` seconds after a Redis error."""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_INTERVAL
+
+
+async def close_response_cache():
+    """Close the shared Redis client."""
+    global _redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+
+
+def _cache_key(endpoint: Callable, kwargs: dict) -> str:
+    """Build a cache key from the endpoint, the current user and its query parameters."""
+    user = kwargs.get("current_user")
+    params = sorted(
+        (name, value) for name, value in kwargs.items()
+        if isinstance(value, (str, int, float, bool)) or value is None
+    )
+    digest = hashlib.blake2b(
+        repr((getattr(user, "id", None), params)).encode(),
+        digest_size=16
+    ).hexdigest()
+    return f"response-cache:{endpoint.__module__}.{endpoint.__qualname__}:{digest}"
+
+
+def cached_response(ttl: int):
+    """Cache an endpoint's JSON body in Redis for ``ttl`` seconds, keyed by user and query parameters."""
+    def decorator(endpoint: Callable):
+        @wraps(endpoint)
+        async def wrapper(*args, **kwargs):
+            cache = get_cache_client()
+            if cache is None:
+                return await endpoint(*args, **kwargs)
+
+            key = _cache_key(endpoint, kwargs)
+
+            try:
+                body = await cache.get(key)
+            except RedisError as e:
+                logger.warning("Response cache read failed: %s", e)
+                mark_cache_unavailable()
+                return await endpoint(*args, **kwargs)
+
+            if body is not None:
+                return Response(content=body, media_type="application/json")
+
+            result = await endpoint(*args, **kwargs)
+            body = _serialize(result)
+
+            try:
+                await cache.set(key, body, ex=ttl)
+            except RedisError as e:
+                logger.warning("Response cache write failed: %s", e)
+                mark_cache_unavailable()
+
+            return Response(content=body, media_type="application/json")
+
+        return wrapper
+    return decorator
+
+
+def _serialize(result: Any) -> bytes:
+    """Serialize an endpoint result to JSON bytes."""
+    if isinstance(result, Response):
+        return result.body
+    if isinstance(result, BaseModel):
+        return result.model_dump_json().encode()
+    return json_dumps(jsonable_encoder(result)).encode()
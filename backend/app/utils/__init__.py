@@ -0,0 +1,6 @@
+from .json import json_loads, json_dumps
+
+__all__ = [
+    "json_loads",
+    "json_dumps"
+]
@@ -0,0 +1,16 @@
+"""
+JSON encoding helpers backed by orjson.
+"""
+from typing import Any, Union
+
+import orjson
+
+
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode a JSON document from str or bytes."""
+    return orjson.loads(data)
+
+
+def json_dumps(obj: Any) -> str:
+    """Encode an object to a JSON string."""
+    return orjson.dumps(obj).decode()
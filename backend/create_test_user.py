@@ -14,7 +14,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models import User, get_db
 from app.services.auth import AuthService
-import json
 
 async def create_test_user():
     """Create a test user for manual testing"""
@@ -49,8 +48,8 @@ async def create_test_user():
                 name=name,
                 hashed_password=hashed_password,
                 role=role,
-                skills_json=json.dumps(["Python", "FastAPI", "React"]),
-                learning_progress_json=json.dumps({})
+                skills_json=["Python", "FastAPI", "React"],
+                learning_progress_json={}
             )
             
             db.add(new_user)
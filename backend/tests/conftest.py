@@ -50,6 +50,11 @@ async def test_db(test_engine):
     async with TestSessionLocal() as session:
         yield session
 
+@pytest.fixture
+async def db_session(test_db):
+    """Database session for service-level tests"""
+    yield test_db
+
 @pytest.fixture
 async def client(test_db):
     """Create test client with test database"""
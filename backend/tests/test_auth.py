@@ -1,9 +1,13 @@
 import pytest
+import time
+from datetime import timedelta
 from httpx import AsyncClient
+from jose import jwt
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.models import User, UserSession
 from app.services.auth import AuthService
+from app.config import settings
 import json
 
 class TestUserRegistration:
@@ -229,6 +233,28 @@ class TestAuthService:
         decoded = AuthService.decode_access_token(invalid_token)
         assert decoded is None
     
+    def test_minted_token_decodes_with_jose(self):
+        """Test that minted tokens are standard JWTs with an integer expiry"""
+        before = int(time.time())
+        token = AuthService.create_access_token({"sub": "user123"}, expires_delta=timedelta(minutes=5))
+        after = int(time.time())
+        
+        claims = jwt.decode(token, settings.secret_key, algorithms=[settings.algorithm])
+        
+        assert jwt.get_unverified_header(token) == {"alg": settings.algorithm, "typ": "JWT"}
+        assert claims["sub"] == "user123"
+        assert isinstance(claims["exp"], int)
+        assert before + 300 <= claims["exp"] <= after + 300
+    
+    def test_tampered_jwt_signature_rejected(self):
+        """Test that a token with an altered signature does not decode"""
+        token = AuthService.create_access_token({"sub": "user123"})
+        signing_input, _, signature = token.rpartition(".")
+        tampered = f"{signing_input}.{'B' if signature[0] == 'A' else 'A'}{signature[1:]}"
+        
+        assert AuthService.decode_access_token(token) is not None
+        assert AuthService.decode_access_token(tampered) is None
+    
     def test_token_hashing(self):
         """Test token hashing for storage"""
         token = "sample_jwt_token"
@@ -3,14 +3,20 @@ Integration tests for MCP service connectivity and data fetching.
 """
 import pytest
 import asyncio
+import httpx
+import orjson
+import time
 from unittest.mock import AsyncMock, patch, MagicMock
 from datetime import datetime
+from uuid import uuid4
 
-from app.services.mcp_client import MCPClientManager, BaseMCPClient, MCPClientError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.services.mcp_client import MCPClientManager, BaseMCPClient, MCPClientError, MCPRateLimitError
 from app.services.mcp_github import GitHubMCPClient, GitLabMCPClient
 from app.services.mcp_jira import JiraMCPClient, AzureDevOpsMCPClient
 from app.models.mcp import (
-    MCPConfig, MCPServiceType, MCPConnectionStatus,
+    MCPConfig, MCPService, MCPServiceType, MCPConnectionStatus,
     RepositoryData, ProjectData, MCPHealthCheck
 )
 
@@ -56,6 +62,90 @@ class TestMCPClientManager:
         """Test client creation with unregistered service type."""
         with pytest.raises(MCPClientError, match="No client registered"):
             await manager.create_client(github_config)
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_connects_share_one_attempt(self, manager):
+        """Test that concurrent connects for a service run a single connect."""
+        release = asyncio.Event()
+        
+        async def wait_for_release(service_id):
+            return await release.wait()
+        
+        connect = AsyncMock(side_effect=wait_for_release)
+        
+        with patch.object(manager, '_connect_service', connect):
+            callers = [asyncio.ensure_future(manager.connect_service("svc")) for _ in range(5)]
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(*callers)
+        
+        assert results == [True] * 5
+        assert connect.await_count == 1
+        assert manager._connect_inflight == {}
+    
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_does_not_cancel_shared_connect(self, manager):
+        """Test that cancelling one waiter leaves the connect running for the rest."""
+        release = asyncio.Event()
+        
+        async def wait_for_release(service_id):
+            return await release.wait()
+        
+        connect = AsyncMock(side_effect=wait_for_release)
+        
+        with patch.object(manager, '_connect_service', connect):
+            callers = [asyncio.ensure_future(manager.connect_service("svc")) for _ in range(3)]
+            await asyncio.sleep(0)
+            callers[0].cancel()
+            release.set()
+            results = await asyncio.gather(*callers, return_exceptions=True)
+        
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert results[1:] == [True, True]
+        assert connect.await_count == 1
+    
+    @pytest.mark.asyncio
+    async def test_failed_connect_is_not_cached(self, manager):
+        """Test that a failed connect is shared by its waiters but retried afterwards."""
+        connect = AsyncMock(side_effect=[MCPClientError("Connection refused"), True])
+        
+        with patch.object(manager, '_connect_service', connect):
+            results = await asyncio.gather(
+                manager.connect_service("svc"),
+                manager.connect_service("svc"),
+                return_exceptions=True
+            )
+            assert all(isinstance(result, MCPClientError) for result in results)
+            
+            assert await manager.connect_service("svc") is True
+        
+        assert connect.await_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_reconnect_disconnects_previous_client(self, manager, test_engine):
+        """Test that reconnecting a service closes the client it replaces."""
+        session_factory = async_sessionmaker(test_engine, class_=AsyncSession, expire_on_commit=False)
+        async with session_factory() as session:
+            service = MCPService(
+                id=str(uuid4()),
+                service_type=MCPServiceType.GITHUB.value,
+                name="Test GitHub",
+                endpoint="https://api.github.com",
+                credentials_json={"token": "test_token"},
+                enabled=True
+            )
+            session.add(service)
+            await session.commit()
+        
+        first_client, second_client = AsyncMock(), AsyncMock()
+        with patch('app.services.mcp_client.AsyncSessionLocal', session_factory), \
+             patch.object(manager, 'create_client', AsyncMock(side_effect=[first_client, second_client])):
+            assert await manager.connect_service(service.id) is True
+            assert await manager.connect_service(service.id) is True
+        
+        assert manager._clients[service.id] is second_client
+        first_client.disconnect.assert_awaited_once()
+        second_client.disconnect.assert_not_awaited()
 
 
 class TestGitHubMCPClient:
@@ -95,7 +185,7 @@ class TestGitHubMCPClient:
     async def test_health_check_success(self, github_client):
         """Test successful GitHub health check."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"login": "testuser", "id": 12345}
+        mock_response.content = orjson.dumps({"login": "testuser", "id": 12345})
         
         with patch.object(github_client, '_make_request', return_value=mock_response):
             health_check = await github_client.health_check()
@@ -117,7 +207,7 @@ class TestGitHubMCPClient:
     async def test_validate_credentials_success(self, github_client):
         """Test successful GitHub credentials validation."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {"login": "testuser", "id": 12345}
+        mock_response.content = orjson.dumps({"login": "testuser", "id": 12345})
         
         with patch.object(github_client, '_make_request', return_value=mock_response):
             is_valid = await github_client.validate_credentials()
@@ -136,7 +226,7 @@ class TestGitHubMCPClient:
     async def test_fetch_repository_data(self, github_client):
         """Test fetching GitHub repository data."""
         mock_response = MagicMock()
-        mock_response.json.return_value = {
+        mock_response.content = orjson.dumps({
             "id": 12345,
             "name": "test-repo",
             "full_name": "testuser/test-repo",
@@ -151,7 +241,7 @@ class TestGitHubMCPClient:
             "stargazers_count": 10,
             "forks_count": 5,
             "topics": ["python", "test"]
-        }
+        })
         
         with patch.object(github_client, '_make_request', return_value=mock_response):
             repo_data = await github_client.fetch_repository_data("testuser/test-repo")
@@ -166,7 +256,7 @@ class TestGitHubMCPClient:
     async def test_list_repositories(self, github_client):
         """Test listing GitHub repositories."""
         mock_response = MagicMock()
-        mock_response.json.return_value = [
+        mock_response.content = orjson.dumps([
             {
                 "id": 12345,
                 "name": "repo1",
@@ -199,7 +289,7 @@ class TestGitHubMCPClient:
                 "forks_count": 10,
                 "topics": ["javascript"]
             }
-        ]
+        ])
         
         with patch.object(github_client, '_make_request', return_value=mock_response):
             repositories = await github_client.list_repositories(limit=10)
@@ -328,10 +418,10 @@ class TestMCPIntegrationFlow:
         
         # Mock responses
         mock_user_response = MagicMock()
-        mock_user_response.json.return_value = {"login": "testuser", "id": 12345}
+        mock_user_response.content = orjson.dumps({"login": "testuser", "id": 12345})
         
         mock_repos_response = MagicMock()
-        mock_repos_response.json.return_value = [
+        mock_repos_response.content = orjson.dumps([
             {
                 "id": 12345,
                 "name": "test-repo",
@@ -348,7 +438,7 @@ class TestMCPIntegrationFlow:
                 "forks_count": 5,
                 "topics": ["python"]
             }
-        ]
+        ])
         
         # Test workflow
         client = await manager.create_client(config)
@@ -415,14 +505,368 @@ class TestMCPIntegrationFlow:
             mock_response.status_code = 200
             mock_response.raise_for_status.return_value = None
             
-            mock_client.request.return_value = mock_response
+            mock_client.request = AsyncMock(return_value=mock_response)
             
             # First request should succeed
             await client._make_request('GET', '/test')
             
             # Second request should be rate limited (would need to wait)
             # This is a simplified test - in reality we'd test the timing
-            assert len(client._rate_limiter["last_request_times"]) == 1
+            assert client._minute_tokens < 1
+            assert client._hour_tokens == pytest.approx(9, abs=0.01)
+
+
+class TestRateLimiting:
+    """Test rate limiter waits against a fake clock."""
+    
+    @pytest.fixture
+    def fake_clock(self):
+        """Patch the limiter's clock and sleeps; a sleep advances the clock once it resumes."""
+        clock = {"now": 1000.0, "sleeps": []}
+        real_sleep = asyncio.sleep
+        
+        async def fake_sleep(delay):
+            wake_at = clock["now"] + delay
+            clock["sleeps"].append(delay)
+            await real_sleep(0)
+            clock["now"] = max(clock["now"], wake_at)
+        
+        with patch('app.services.mcp_client.time') as mock_time, \
+             patch('app.services.mcp_client.asyncio.sleep', fake_sleep):
+            mock_time.monotonic.side_effect = lambda: clock["now"]
+            yield clock
+    
+    @staticmethod
+    def make_client(requests_per_minute: int, requests_per_hour: int) -> GitHubMCPClient:
+        return GitHubMCPClient(MCPConfig(
+            service_type=MCPServiceType.GITHUB,
+            name="Rate Limit Test",
+            endpoint="https://api.github.com",
+            credentials={"token": "test_token"},
+            enabled=True,
+            rate_limits={"requests_per_minute": requests_per_minute, "requests_per_hour": requests_per_hour}
+        ))
+    
+    @pytest.mark.asyncio
+    async def test_empty_minute_bucket_waits_for_refill(self, fake_clock):
+        """Test that waiters re-check after a refill instead of overdrawing the bucket."""
+        client = self.make_client(requests_per_minute=1, requests_per_hour=1000)
+        await client._check_rate_limit()
+        
+        await asyncio.gather(client._check_rate_limit(), client._check_rate_limit())
+        
+        # Both waiters sleep for the next token; the one that loses the race sleeps again
+        assert fake_clock["sleeps"] == [60.0, 60.0, 60.0]
+        assert fake_clock["now"] == 1120.0
+        assert client._minute_tokens == pytest.approx(0)
+    
+    @pytest.mark.asyncio
+    async def test_empty_hour_bucket_raises(self, fake_clock):
+        """Test that an exhausted hourly budget raises instead of waiting."""
+        client = self.make_client(requests_per_minute=10, requests_per_hour=1)
+        await client._check_rate_limit()
+        
+        with pytest.raises(MCPRateLimitError, match="Hourly rate limit exceeded"):
+            await client._check_rate_limit()
+        
+        assert fake_clock["sleeps"] == []
+    
+    @pytest.mark.asyncio
+    async def test_retry_after_window_delays_concurrent_callers(self, fake_clock):
+        """Test that a Retry-After window holds back every caller until it ends."""
+        client = self.make_client(requests_per_minute=60, requests_per_hour=1000)
+        client._blocked_until = fake_clock["now"] + 30
+        finished_at = []
+        
+        async def call():
+            await client._check_rate_limit()
+            finished_at.append(fake_clock["now"])
+        
+        await asyncio.gather(call(), call())
+        
+        assert fake_clock["sleeps"] == [30.0, 30.0]
+        assert finished_at == [1030.0, 1030.0]
+    
+    @pytest.mark.asyncio
+    async def test_rate_limited_response_blocks_other_callers(self, fake_clock):
+        """Test that a 429 sets a window that concurrent requests also wait out."""
+        client = self.make_client(requests_per_minute=60, requests_per_hour=1000)
+        
+        limited = MagicMock(status_code=429, headers={"Retry-After": "30"})
+        ok = MagicMock(status_code=200)
+        finished_at = []
+        
+        async def call(url):
+            response = await client._make_request('GET', url)
+            finished_at.append(fake_clock["now"])
+            return response
+        
+        with patch.object(client, '_client') as mock_client:
+            mock_client.request = AsyncMock(side_effect=[limited, ok, ok])
+            responses = await asyncio.gather(call('/first'), call('/second'))
+        
+        assert responses == [ok, ok]
+        assert mock_client.request.await_count == 3
+        assert fake_clock["sleeps"] == [30.0, 30.0]
+        assert finished_at == [1030.0, 1030.0]
+
+
+class FakeRedis:
+    """In-memory stand-in for the hash commands used by the upstream GET cache."""
+    
+    def __init__(self):
+        self.hashes = {}
+    
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+    
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """Buffers HSET calls and applies them on execute, as a Redis pipeline does."""
+    
+    def __init__(self, redis):
+        self.redis = redis
+        self.writes = []
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        return False
+    
+    def hset(self, key, mapping):
+        self.writes.append((key, mapping))
+    
+    def expire(self, key, seconds):
+        pass
+    
+    async def execute(self):
+        for key, mapping in self.writes:
+            self.redis.hashes.setdefault(key, {}).update({
+                field.encode(): value if isinstance(value, bytes) else str(value).encode()
+                for field, value in mapping.items()
+            })
+
+
+class TestUpstreamCache:
+    """Test ETag revalidation and stale fallback of cached upstream GETs."""
+    
+    REPO = {"id": 1, "name": "repo", "full_name": "owner/repo"}
+    URL = "https://api.github.com/repos/owner/repo"
+    
+    @pytest.fixture
+    def redis(self):
+        """Install an in-memory cache client."""
+        redis = FakeRedis()
+        with patch('app.services.mcp_client.get_cache_client', return_value=redis):
+            yield redis
+    
+    @staticmethod
+    def make_client(handler) -> GitHubMCPClient:
+        client = GitHubMCPClient(MCPConfig(
+            service_type=MCPServiceType.GITHUB,
+            name="Cache Test",
+            endpoint="https://api.github.com",
+            credentials={"token": "test_token"},
+            enabled=True,
+            retry_attempts=1
+        ))
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client
+    
+    @staticmethod
+    def expire_entries(redis):
+        for entry in redis.hashes.values():
+            entry[b"fresh_until"] = b"0"
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_revalidates_expired_entry(self, redis):
+        """Test that an expired entry is revalidated with its ETag and served from cache."""
+        seen_etags = []
+        
+        def handler(request):
+            seen_etags.append(request.headers.get("If-None-Match"))
+            if request.headers.get("If-None-Match") == '"v1"':
+                return httpx.Response(304)
+            return httpx.Response(200, content=orjson.dumps(self.REPO), headers={"ETag": '"v1"'})
+        
+        client = self.make_client(handler)
+        assert await client._get_json(self.URL, 30) == self.REPO
+        self.expire_entries(redis)
+        
+        assert await client._get_json(self.URL, 30) == self.REPO
+        assert await client._get_json(self.URL, 30) == self.REPO
+        
+        assert seen_etags == [None, '"v1"']
+        (entry,) = redis.hashes.values()
+        assert float(entry[b"fresh_until"]) > time.time()
+    
+    @pytest.mark.asyncio
+    async def test_not_modified_rewrites_entry_evicted_since_read(self, redis):
+        """Test that a 304 restores the whole entry if the key vanished after it was read."""
+        def handler(request):
+            if request.headers.get("If-None-Match"):
+                redis.hashes.clear()
+                return httpx.Response(304)
+            return httpx.Response(200, content=orjson.dumps(self.REPO), headers={"ETag": '"v1"'})
+        
+        client = self.make_client(handler)
+        await client._get_json(self.URL, 30)
+        self.expire_entries(redis)
+        
+        assert await client._get_json(self.URL, 30) == self.REPO
+        
+        (entry,) = redis.hashes.values()
+        assert entry[b"body"] == orjson.dumps(self.REPO)
+        assert entry[b"etag"] == b'"v1"'
+        assert await client._get_json(self.URL, 30) == self.REPO
+    
+    @pytest.mark.asyncio
+    async def test_entry_without_body_is_a_miss(self, redis):
+        """Test that a partial hash is refetched instead of read."""
+        client = self.make_client(
+            lambda request: httpx.Response(200, content=orjson.dumps(self.REPO), headers={"ETag": '"v2"'})
+        )
+        key = client._upstream_cache_key(self.URL, None)
+        redis.hashes[key] = {b"fresh_until": str(time.time() + 60).encode()}
+        
+        assert await client._get_json(self.URL, 30) == self.REPO
+        assert redis.hashes[key][b"etag"] == b'"v2"'
+    
+    @pytest.mark.asyncio
+    async def test_stale_entry_served_when_service_fails(self, redis):
+        """Test that the last good body is served when revalidation fails."""
+        responses = iter([
+            httpx.Response(200, content=orjson.dumps(self.REPO), headers={"ETag": '"v1"'}),
+            httpx.Response(503)
+        ])
+        client = self.make_client(lambda request: next(responses))
+        await client._get_json(self.URL, 30)
+        self.expire_entries(redis)
+        
+        assert await client._get_json(self.URL, 30) == self.REPO
+    
+    @pytest.mark.asyncio
+    async def test_failure_without_cached_entry_raises(self, redis):
+        """Test that a failing service with nothing cached still raises."""
+        client = self.make_client(lambda request: httpx.Response(503))
+        
+        with pytest.raises(MCPClientError):
+            await client._get_json(self.URL, 30)
+
+
+class TestPagination:
+    """Test page fan-out for ``page``/``per_page`` listings."""
+    
+    URL = "https://api.github.com/user/repos"
+    
+    @pytest.fixture(autouse=True)
+    def no_cache(self):
+        """Fetch every page from the service."""
+        with patch('app.services.mcp_client.get_cache_client', return_value=None):
+            yield
+    
+    @staticmethod
+    def make_client(total_items, pagination_headers=None, before_page=None):
+        """Client over a listing of ``total_items`` ids; records the pages requested."""
+        requested = []
+        
+        async def handler(request):
+            page = int(request.url.params["page"])
+            per_page = int(request.url.params["per_page"])
+            requested.append(page)
+            if before_page is not None:
+                await before_page(page)
+            items = list(range((page - 1) * per_page, min(page * per_page, total_items)))
+            headers = pagination_headers(page, per_page) if pagination_headers else {}
+            return httpx.Response(200, content=orjson.dumps(items), headers=headers)
+        
+        client = GitHubMCPClient(MCPConfig(
+            service_type=MCPServiceType.GITHUB,
+            name="Pagination Test",
+            endpoint="https://api.github.com",
+            credentials={"token": "test_token"},
+            enabled=True
+        ))
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return client, requested
+    
+    @staticmethod
+    def last_link(total_items):
+        def headers(page, per_page):
+            last_page = -(-total_items // per_page)
+            if page >= last_page:
+                return {}
+            return {"Link": (
+                f'<{TestPagination.URL}?page={page + 1}&per_page={per_page}>; rel="next", '
+                f'<{TestPagination.URL}?page={last_page}&per_page={per_page}>; rel="last"'
+            )}
+        return headers
+    
+    @staticmethod
+    def total_pages_header(total_items):
+        return lambda page, per_page: {"X-Total-Pages": str(-(-total_items // per_page))}
+    
+    @pytest.mark.asyncio
+    async def test_link_last_bounds_fan_out(self):
+        """Test that a rel="last" link caps the pages requested."""
+        client, requested = self.make_client(250, self.last_link(250))
+        
+        items = await client._get_pages(self.URL, 10, {}, limit=1000)
+        
+        assert items == list(range(250))
+        assert sorted(requested) == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_total_pages_header_bounds_fan_out(self):
+        """Test that X-Total-Pages caps the pages requested."""
+        client, requested = self.make_client(200, self.total_pages_header(200))
+        
+        items = await client._get_pages(self.URL, 10, {}, limit=1000)
+        
+        assert items == list(range(200))
+        assert sorted(requested) == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_without_page_count_pages_are_walked_in_order(self):
+        """Test the sequential fallback when the service reports no page count."""
+        client, requested = self.make_client(200)
+        
+        items = await client._get_pages(self.URL, 10, {}, limit=1000)
+        
+        assert items == list(range(200))
+        assert requested == [1, 2, 3]
+    
+    @pytest.mark.asyncio
+    async def test_limit_truncates_across_pages(self):
+        """Test that only ``limit`` items are returned and no page past it is requested."""
+        client, requested = self.make_client(1000, self.total_pages_header(1000))
+        
+        items = await client._get_pages(self.URL, 10, {}, limit=150)
+        
+        assert items == list(range(150))
+        assert sorted(requested) == [1, 2]
+    
+    @pytest.mark.asyncio
+    async def test_pages_finishing_out_of_order_keep_listing_order(self):
+        """Test that items stay in listing order when later pages arrive first."""
+        last_page_served = asyncio.Event()
+        
+        async def before_page(page):
+            if page == 2:
+                await last_page_served.wait()
+            elif page == 3:
+                last_page_served.set()
+        
+        client, requested = self.make_client(250, self.last_link(250), before_page)
+        
+        items = await client._get_pages(self.URL, 10, {}, limit=1000)
+        
+        assert items == list(range(250))
+        assert requested == [1, 2, 3]
 
 
 @pytest.mark.asyncio
@@ -3,7 +3,6 @@ Integration tests for project management data synchronization reliability.
 """
 import pytest
 import asyncio
-import json
 from datetime import datetime, timedelta
 from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
@@ -30,10 +29,10 @@ class TestDataSynchronizationReliability:
             service_type=MCPServiceType.JIRA.value,
             name="Test Jira",
             endpoint="https://test.atlassian.net",
-            credentials_json=json.dumps({
+            credentials_json={
                 "username": "test@example.com",
                 "api_token": "test_token"
-            }),
+            },
             enabled=True,
             status=MCPConnectionStatus.CONNECTED.value
         )
@@ -50,10 +49,10 @@ class TestDataSynchronizationReliability:
             service_type=MCPServiceType.AZURE_DEVOPS.value,
             name="Test Azure DevOps",
             endpoint="https://dev.azure.com/testorg",
-            credentials_json=json.dumps({
+            credentials_json={
                 "organization": "testorg",
                 "personal_access_token": "test_pat"
-            }),
+            },
             enabled=True,
             status=MCPConnectionStatus.CONNECTED.value
         )
@@ -444,7 +443,7 @@ class TestDataSynchronizationReliability:
             assert abs(analytics.avg_completion_time_days - expected_avg_completion) < 0.1
             
             # Verify workflow patterns
-            workflow_patterns = json.loads(analytics.workflow_patterns_json)
+            workflow_patterns = analytics.workflow_patterns_json
             assert workflow_patterns["status_distribution"]["Done"] == 2
             assert workflow_patterns["status_distribution"]["In Progress"] == 1
             assert workflow_patterns["status_distribution"]["To Do"] == 1
@@ -452,7 +451,7 @@ class TestDataSynchronizationReliability:
             assert workflow_patterns["type_distribution"]["Bug"] == 1
             
             # Verify communication patterns
-            communication_patterns = json.loads(analytics.communication_patterns_json)
+            communication_patterns = analytics.communication_patterns_json
             assert communication_patterns["most_active_assignees"]["Developer 1"] == 2
             assert communication_patterns["most_active_assignees"]["Developer 2"] == 2
             assert communication_patterns["most_active_reporters"]["Manager 1"] == 4
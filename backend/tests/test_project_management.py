@@ -8,12 +8,13 @@ from unittest.mock import AsyncMock, patch, MagicMock
 from uuid import uuid4
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, text
 
 from app.models.project_management import (
     ProjectManagementProject, WorkItem, TeamMember, Workflow, ProjectAnalytics
 )
 from app.models.mcp import MCPService, MCPServiceType, MCPConnectionStatus
+from app.models.database import _add_work_item_key
 from app.services.project_management import ProjectManagementService
 from app.services.mcp_jira import JiraMCPClient
 from app.services.mcp_client import mcp_manager
@@ -27,10 +28,10 @@ async def mock_mcp_service(db_session: AsyncSession):
         service_type=MCPServiceType.JIRA.value,
         name="Test Jira",
         endpoint="https://test.atlassian.net",
-        credentials_json=json.dumps({
+        credentials_json={
             "username": "test@example.com",
             "api_token": "test_token"
-        }),
+        },
         enabled=True,
         status=MCPConnectionStatus.CONNECTED.value
     )
@@ -108,6 +109,23 @@ def mock_work_items():
     ]
 
 
+@pytest.fixture
+async def mock_project(db_session: AsyncSession, mock_mcp_service):
+    """Create a project to sync work items into."""
+    project = ProjectManagementProject(
+        id=str(uuid4()),
+        external_id="TEST-123",
+        service_id=mock_mcp_service.id,
+        name="Test Project",
+        key="TEST",
+        project_type="jira",
+        status="active"
+    )
+    db_session.add(project)
+    await db_session.commit()
+    return project
+
+
 class TestProjectManagementService:
     """Test cases for ProjectManagementService."""
 
@@ -198,6 +216,112 @@ class TestProjectManagementService:
         assert overview.completed_work_items == 6
         assert overview.active_team_members == 5
 
+    @pytest.mark.asyncio
+    async def test_work_item_updated_at_not_before_created_at(self, db_session: AsyncSession, mock_project, mock_work_items):
+        """Test that re-syncing a work item never stamps updated_at before created_at."""
+        service = ProjectManagementService(db_session)
+        
+        await service._sync_work_items(mock_project.id, mock_work_items)
+        await service._sync_work_items(mock_project.id, mock_work_items)
+        
+        result = await db_session.execute(
+            select(WorkItem.created_at, WorkItem.updated_at).where(WorkItem.project_id == mock_project.id)
+        )
+        rows = result.all()
+        
+        assert len(rows) == 2
+        for created_at, updated_at in rows:
+            assert updated_at >= created_at
+
+
+class TestWorkItemSync:
+    """Test cases for the work item upsert and its unique key."""
+
+    @pytest.mark.asyncio
+    async def test_resync_is_idempotent_and_updates_fields(self, db_session: AsyncSession, mock_project, mock_work_items):
+        """Test that syncing the same items again updates rows in place."""
+        service = ProjectManagementService(db_session)
+        
+        assert await service._sync_work_items(mock_project.id, mock_work_items) == 2
+        result = await db_session.execute(
+            select(WorkItem.external_id, WorkItem.id).where(WorkItem.project_id == mock_project.id)
+        )
+        ids_before = dict(result.all())
+        
+        changed = [dict(item) for item in mock_work_items]
+        changed[0]["title"] = "Implement SSO"
+        changed[0]["labels"] = ["backend"]
+        assert await service._sync_work_items(mock_project.id, changed) == 2
+        
+        result = await db_session.execute(
+            select(WorkItem)
+            .where(WorkItem.project_id == mock_project.id)
+            .order_by(WorkItem.external_id)
+            .execution_options(populate_existing=True)
+        )
+        items = result.scalars().all()
+        
+        assert len(items) == 2
+        assert {item.external_id: item.id for item in items} == ids_before
+        assert items[0].title == "Implement SSO"
+        assert items[0].labels_json == ["backend"]
+        assert items[1].title == "Fix login bug"
+
+    @pytest.mark.asyncio
+    async def test_labels_are_normalized_to_strings(self, db_session: AsyncSession, mock_project):
+        """Test that labels are stored as a list of strings."""
+        service = ProjectManagementService(db_session)
+        
+        await service._sync_work_items(mock_project.id, [
+            {"id": "TEST-1", "title": "Numbered labels", "labels": [1, "two", 3.5]},
+            {"id": "TEST-2", "title": "No labels", "labels": None}
+        ])
+        
+        result = await db_session.execute(
+            select(WorkItem.external_id, WorkItem.labels_json).where(WorkItem.project_id == mock_project.id)
+        )
+        labels = dict(result.all())
+        
+        assert labels == {"TEST-1": ["1", "two", "3.5"], "TEST-2": []}
+
+    @pytest.mark.asyncio
+    async def test_add_work_item_key_removes_duplicates(self, test_engine, mock_project):
+        """Test upgrading a work_items table created before the unique key."""
+        async with test_engine.begin() as conn:
+            await conn.execute(text("DROP INDEX uq_work_items_project_external"))
+            for row_id, title, updated_at in [
+                ("a", "old", "2024-01-01 00:00:00"),
+                ("b", "new", "2024-02-01 00:00:00"),
+                ("c", "other", "2024-01-01 00:00:00")
+            ]:
+                await conn.execute(
+                    text(
+                        "INSERT INTO work_items (id, external_id, project_id, title, item_type, status, updated_at) "
+                        "VALUES (:id, :external_id, :project_id, :title, 'task', 'open', :updated_at)"
+                    ),
+                    {
+                        "id": row_id,
+                        "external_id": "TEST-2" if row_id == "c" else "TEST-1",
+                        "project_id": mock_project.id,
+                        "title": title,
+                        "updated_at": updated_at
+                    }
+                )
+        
+        async with test_engine.begin() as conn:
+            await _add_work_item_key(conn)
+        async with test_engine.begin() as conn:
+            await _add_work_item_key(conn)
+            result = await conn.execute(text("SELECT id, title FROM work_items ORDER BY id"))
+            rows = result.all()
+            indexes = await conn.execute(text(
+                "SELECT sql FROM sqlite_master WHERE name = 'uq_work_items_project_external'"
+            ))
+            index_sql = indexes.scalar_one()
+        
+        assert [tuple(row) for row in rows] == [("b", "new"), ("c", "other")]
+        assert index_sql.startswith("CREATE UNIQUE INDEX")
+
 
 class TestJiraMCPClient:
     """Test cases for Jira MCP client."""
@@ -0,0 +1,92 @@
+"""
+Tests for Redis-backed endpoint response caching.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from fastapi.responses import Response
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from app.services import response_cache
+from app.services.response_cache import cached_response, get_cache_client, init_response_cache
+
+
+@pytest.fixture
+def redis_client(monkeypatch):
+    """Install a mock Redis client as the shared cache client."""
+    client = MagicMock()
+    client.get = AsyncMock(return_value=None)
+    client.set = AsyncMock()
+    monkeypatch.setattr(response_cache, "_redis_client", client)
+    monkeypatch.setattr(response_cache, "_redis_down_until", 0.0)
+    return client
+
+
+def make_endpoint():
+    """Build a cached endpoint and the mock it delegates to."""
+    handler = AsyncMock(return_value={"total_projects": 3})
+
+    @cached_response(ttl=15)
+    async def dashboard(current_user=None):
+        return await handler(current_user=current_user)
+
+    return dashboard, handler
+
+
+class TestCachedResponse:
+    """Test cases for the cached_response decorator."""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_endpoint(self, redis_client):
+        """Test that a cached body is returned without calling the endpoint."""
+        redis_client.get.return_value = b'{"total_projects":1}'
+        dashboard, handler = make_endpoint()
+
+        response = await dashboard(current_user=None)
+
+        assert isinstance(response, Response)
+        assert response.body == b'{"total_projects":1}'
+        handler.assert_not_awaited()
+        redis_client.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_body(self, redis_client):
+        """Test that a miss calls the endpoint and stores its JSON body."""
+        dashboard, handler = make_endpoint()
+
+        response = await dashboard(current_user=None)
+
+        assert response.body == b'{"total_projects":3}'
+        handler.assert_awaited_once()
+        key, body = redis_client.set.await_args.args
+        assert key == redis_client.get.await_args.args[0]
+        assert body == b'{"total_projects":3}'
+        assert redis_client.set.await_args.kwargs == {"ex": 15}
+
+    @pytest.mark.asyncio
+    async def test_redis_error_passes_through_and_backs_off(self, redis_client):
+        """Test that a Redis error serves the endpoint directly and skips the cache for a while."""
+        redis_client.get.side_effect = RedisConnectionError("Connection refused")
+        dashboard, handler = make_endpoint()
+
+        assert await dashboard(current_user=None) == {"total_projects": 3}
+        assert get_cache_client() is None
+
+        assert await dashboard(current_user=None) == {"total_projects": 3}
+        assert redis_client.get.await_count == 1
+        assert handler.await_count == 2
+        redis_client.set.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_init_leaves_cache_disabled_when_redis_unreachable(self, monkeypatch):
+        """Test that startup keeps caching off when Redis doesn't answer a ping."""
+        monkeypatch.setattr(response_cache, "_redis_client", None)
+        client = MagicMock()
+        client.ping = AsyncMock(side_effect=RedisConnectionError("Connection refused"))
+        client.aclose = AsyncMock()
+
+        with patch("app.services.response_cache.redis.from_url", return_value=client):
+            await init_response_cache()
+
+        assert get_cache_client() is None
+        client.aclose.assert_awaited_once()
@@ -74,6 +74,7 @@ export default function ProjectDashboard() {
   const [loading, setLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
   const [syncing, setSyncing] = useState(false);
+  const [syncErrors, setSyncErrors] = useState<string[]>([]);
 
   const fetchDashboardData = async () => {
     try {
@@ -128,6 +129,7 @@ export default function ProjectDashboard() {
 
   const syncAllProjects = async () => {
     setSyncing(true);
+    setSyncErrors([]);
     try {
       const token = localStorage.getItem('token');
       const response = await fetch('/api/v1/project-management/sync-all', {
@@ -143,6 +145,15 @@ export default function ProjectDashboard() {
         throw new Error(errorData.detail || 'Failed to sync projects');
       }
 
+      // The body is NDJSON: one status line per project, then a summary line
+      const failures = (await response.text())
+        .split('\n')
+        .filter((line) => line.trim())
+        .map((line) => JSON.parse(line))
+        .filter((result) => result.sync_status === 'error')
+        .map((result) => `${result.project_id}: ${(result.errors || []).join('; ') || 'Sync failed'}`);
+      setSyncErrors(failures);
+
       // Refresh dashboard data after sync
       await fetchDashboardData();
     } catch (err) {
@@ -204,6 +215,20 @@ export default function ProjectDashboard() {
         </Button>
       </div>
 
+      {syncErrors.length > 0 && (
+        <div className="rounded-md border border-red-200 bg-red-50 p-4">
+          <div className="flex items-center text-red-700 font-medium mb-2">
+            <AlertCircle className="h-4 w-4 mr-2" />
+            {syncErrors.length} project{syncErrors.length === 1 ? '' : 's'} failed to sync
+          </div>
+          <ul className="list-disc pl-6 text-sm text-red-600 space-y-1">
+            {syncErrors.map((message, index) => (
+              <li key={index}>{message}</li>
+            ))}
+          </ul>
+        </div>
+      )}
+
       {/* Metrics Cards */}
       <div className="grid grid-cols-1 md:grid-cols-2 lg:grid-cols-4 gap-6">
         <Card>